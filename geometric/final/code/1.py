@@ -8,6 +8,29 @@
 import pulp
 import matplotlib.pyplot as plt
 import numpy as np
+import highspy
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from scipy import sparse
+from scipy.optimize import milp, LinearConstraint, Bounds
+from lp_presolve import normalize_bounds, presolve_lp, postsolve_lp, format_presolve_report
+from lp_pdhg import solve_lp_pdhg
+
+# 机床生产问题的矩阵形式数据（变量顺序为 [甲机床数量, 乙机床数量]）
+MACHINE_C = np.array([4000.0, 3000.0])
+MACHINE_A_UB = np.array([[2.0, 1.0], [1.0, 1.0], [0.0, 1.0]])
+MACHINE_B_UB = np.array([10.0, 8.0, 7.0])
+MACHINE_CONSTRAINT_NAMES = ["A机器时间约束", "B机器时间约束", "C机器时间约束"]
+
+# 与 pulp.LpStatus 一致的求解状态名称
+MILP_STATUS = {
+    0: "Optimal",
+    1: "Not Solved",
+    2: "Infeasible",
+    3: "Unbounded",
+    4: "Undefined",
+}
 
 
 def solve_machine_production():
@@ -79,6 +102,598 @@ def solve_machine_production():
         "max_profit_int": pulp.value(prob_int.objective),
     }
 
+
+def solve_lp_matrix(
+    c,
+    A_ub,
+    b_ub,
+    bounds=None,
+    integrality=None,
+    maximize=True,
+    presolve=False,
+    method="highs",
+    tol=1e-6,
+):
+    """
+    以矩阵形式求解线性规划/整数线性规划
+
+    直接把系数矩阵交给 HiGHS 在进程内求解，不构造 PuLP 表达式，
+    也不写模型文件、不启动 CBC 子进程，建模开销只与非零元个数有关。
+
+    参数:
+    c - 目标函数系数，长度为n
+    A_ub - 不等式约束矩阵 (m x n)，numpy数组或scipy.sparse矩阵
+    b_ub - 不等式约束右端项，长度为m
+    bounds - 变量边界，格式见 normalize_bounds，默认 x >= 0
+    integrality - 整数标记，长度为n，1表示整数变量；None表示全部为连续变量
+    maximize - 是否为最大化问题，默认True
+    presolve - 是否先用 presolve_lp 化简模型，求解后再还原为原模型的解
+    method - "highs"（单纯形/分支定界，精确解）或 "pdhg"（一阶方法，
+             只用稀疏矩阵-向量乘法，适合超大规模线性规划，见 lp_pdhg.py）
+    tol - method="pdhg" 时的相对收敛容差
+
+    返回:
+    字典，包含 x（最优解）、objective（最优目标值）、status（求解状态）；
+    presolve=True 时另含 presolve_report（预处理删除的行列统计）
+    """
+    if presolve:
+        presolved = presolve_lp(c, A_ub, b_ub, bounds, maximize, integrality=integrality)
+        if presolved["status"] == "Infeasible":
+            return {
+                "x": None,
+                "objective": None,
+                "status": "Infeasible",
+                "presolve_report": presolved["report"],
+            }
+        col_index = presolved["col_index"]
+        if len(col_index) == 0:
+            x = postsolve_lp(presolved, [])
+            result = {"x": x, "objective": presolved["offset"], "status": "Optimal"}
+        else:
+            result = solve_lp_matrix(
+                presolved["c"],
+                presolved["A_ub"],
+                presolved["b_ub"],
+                presolved["bounds"],
+                None if integrality is None else np.asarray(integrality)[col_index],
+                maximize,
+                method=method,
+                tol=tol,
+            )
+            if result["x"] is not None:
+                result["x"] = postsolve_lp(presolved, result["x"])
+                result["objective"] += presolved["offset"]
+        result["presolve_report"] = presolved["report"]
+        return result
+
+    if method == "pdhg":
+        if integrality is not None and np.any(integrality):
+            raise ValueError("pdhg 只能求解线性规划，不支持整数变量")
+        result = solve_lp_pdhg(c, A_ub, b_ub, bounds, maximize, tol=tol)
+        return {
+            "x": result["x"],
+            "objective": result["objective"],
+            "status": result["status"],
+            "iterations": result["iterations"],
+        }
+
+    c = np.asarray(c, dtype=float)
+    A_ub = sparse.csr_array(A_ub, dtype=float)
+    b_ub = np.asarray(b_ub, dtype=float)
+    lb, ub = normalize_bounds(bounds, len(c))
+
+    # milp 只做最小化，最大化问题将目标取反
+    sign = -1.0 if maximize else 1.0
+    res = milp(
+        sign * c,
+        constraints=LinearConstraint(A_ub, -np.inf, b_ub),
+        bounds=Bounds(lb, ub),
+        integrality=integrality,
+    )
+
+    return {
+        "x": res.x,
+        "objective": sign * res.fun if res.x is not None else None,
+        "status": MILP_STATUS.get(res.status, "Undefined"),
+    }
+
+
+def solve_machine_production_matrix(
+    c=MACHINE_C,
+    A_ub=MACHINE_A_UB,
+    b_ub=MACHINE_B_UB,
+    bounds=None,
+    integrality=None,
+    branch_and_bound=False,
+):
+    """
+    矩阵形式的机床生产问题求解，分别求连续解与整数解
+
+    参数:
+    c - 各产品的单位利润
+    A_ub - 机器加工时间矩阵（每行一种机器，每列一种产品）
+    b_ub - 各机器每天可用时数
+    bounds - 变量边界，默认 x >= 0
+    integrality - 整数解使用的整数标记，默认全部变量取整
+    branch_and_bound - 为True时用 solve_ilp_branch_and_bound 求整数解，
+                       直接复用其根节点的线性松弛结果作为连续解
+
+    返回:
+    与 solve_machine_production 相同格式的结果字典：
+    x1, x2, ... - 连续解；max_profit - 最大利润；
+    x1_int, x2_int, ... - 整数解；max_profit_int - 整数解最大利润
+    """
+    n = len(c)
+    if integrality is None:
+        integrality = np.ones(n, dtype=int)
+
+    if branch_and_bound:
+        integer = solve_ilp_branch_and_bound(c, A_ub, b_ub, bounds, integrality)
+        relaxed = integer["relaxation"]
+    else:
+        relaxed = solve_lp_matrix(c, A_ub, b_ub, bounds)
+        integer = solve_lp_matrix(c, A_ub, b_ub, bounds, integrality=integrality)
+
+    result = {}
+    for i in range(n):
+        result[f"x{i + 1}"] = None if relaxed["x"] is None else relaxed["x"][i]
+    result["max_profit"] = relaxed["objective"]
+    for i in range(n):
+        result[f"x{i + 1}_int"] = None if integer["x"] is None else integer["x"][i]
+    result["max_profit_int"] = integer["objective"]
+
+    return result
+
+
+def build_highs_model(c, A_ub, b_ub, bounds=None, integrality=None, maximize=True):
+    """
+    根据矩阵形式的数据构造 HiGHS 模型
+
+    模型对象可以反复修改目标系数和右端项后再次求解，
+    HiGHS 会保留上一次的最优基作为热启动。
+
+    参数:
+    c, A_ub, b_ub, bounds, integrality, maximize - 含义同 solve_lp_matrix
+
+    返回:
+    h - 已载入模型的 highspy.Highs 对象
+    """
+    c = np.asarray(c, dtype=float)
+    A = sparse.csc_array(A_ub, dtype=float)
+    lb, ub = normalize_bounds(bounds, len(c))
+
+    lp = highspy.HighsLp()
+    lp.num_col_ = A.shape[1]
+    lp.num_row_ = A.shape[0]
+    lp.col_cost_ = c
+    lp.col_lower_ = lb
+    lp.col_upper_ = ub
+    lp.row_lower_ = np.full(A.shape[0], -np.inf)
+    lp.row_upper_ = np.asarray(b_ub, dtype=float)
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    lp.a_matrix_.start_ = A.indptr
+    lp.a_matrix_.index_ = A.indices
+    lp.a_matrix_.value_ = A.data
+    lp.sense_ = highspy.ObjSense.kMaximize if maximize else highspy.ObjSense.kMinimize
+    if integrality is not None:
+        lp.integrality_ = [
+            highspy.HighsVarType.kInteger if flag else highspy.HighsVarType.kContinuous
+            for flag in integrality
+        ]
+
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    h.passModel(lp)
+    return h
+
+
+def _solve_scenario_chunk(args):
+    """
+    在一个工作进程中依次求解一段场景
+
+    同一个模型只构造一次，每个场景只修改目标系数和右端项，
+    求解时自动从上一个场景的最优基热启动。
+    """
+    c, A_ub, b_ub, bounds, maximize, costs, rhs = args
+    h = build_highs_model(c, A_ub, b_ub, bounds, maximize=maximize)
+    n, m = len(c), len(b_ub)
+    col_index = np.arange(n, dtype=np.int32)
+    row_index = np.arange(m, dtype=np.int32)
+    row_lower = np.full(m, -np.inf)
+
+    count = len(costs)
+    x = np.full((count, n), np.nan)
+    objective = np.full(count, np.nan)
+    optimal = np.zeros(count, dtype=bool)
+    for k in range(count):
+        h.changeColsCost(n, col_index, costs[k])
+        h.changeRowsBounds(m, row_index, row_lower, rhs[k])
+        h.run()
+        if h.getModelStatus() == highspy.HighsModelStatus.kOptimal:
+            x[k] = h.getSolution().col_value
+            objective[k] = h.getInfo().objective_function_value
+            optimal[k] = True
+
+    return x, objective, optimal
+
+
+def solve_production_scenarios(
+    rhs_table=None,
+    cost_table=None,
+    c=MACHINE_C,
+    A_ub=MACHINE_A_UB,
+    b_ub=MACHINE_B_UB,
+    bounds=None,
+    maximize=True,
+    max_workers=None,
+):
+    """
+    批量求解机床生产问题的假设场景（机器时数、单位利润的扫描）
+
+    所有场景共用同一个约束矩阵，场景按顺序分段交给进程池，
+    每段内复用一个模型并从上一个最优基热启动。
+
+    参数:
+    rhs_table - 各场景的机器可用时数，形状 (场景数, m)；None表示都使用 b_ub
+    cost_table - 各场景的单位利润，形状 (场景数, n)；None表示都使用 c
+    c, A_ub, b_ub, bounds, maximize - 基准模型，含义同 solve_lp_matrix
+    max_workers - 进程数，None表示使用CPU核数，1表示在当前进程内求解
+
+    返回:
+    字典，按列存放各场景结果：
+    x - 最优解，形状 (场景数, n)，无最优解的场景为 nan
+    max_profit - 最优目标值，形状 (场景数,)
+    optimal - 是否求得最优解，形状 (场景数,)
+    """
+    c = np.asarray(c, dtype=float)
+    b_ub = np.asarray(b_ub, dtype=float)
+    A_ub = sparse.csc_array(A_ub, dtype=float)
+    if rhs_table is None and cost_table is None:
+        raise ValueError("rhs_table 和 cost_table 至少需要给出一个")
+
+    # 未给出的一方按基准模型补齐
+    count = len(rhs_table) if rhs_table is not None else len(cost_table)
+    rhs = (
+        np.broadcast_to(b_ub, (count, len(b_ub)))
+        if rhs_table is None
+        else np.asarray(rhs_table, dtype=float)
+    )
+    costs = (
+        np.broadcast_to(c, (count, len(c)))
+        if cost_table is None
+        else np.asarray(cost_table, dtype=float)
+    )
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    n_chunks = max(1, min(max_workers, count))
+    splits = np.array_split(np.arange(count), n_chunks)
+    tasks = [
+        (c, A_ub, b_ub, bounds, maximize, costs[idx], rhs[idx]) for idx in splits
+    ]
+
+    if n_chunks == 1:
+        results = [_solve_scenario_chunk(tasks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=n_chunks) as pool:
+            results = list(pool.map(_solve_scenario_chunk, tasks))
+
+    return {
+        "x": np.vstack([r[0] for r in results]),
+        "max_profit": np.concatenate([r[1] for r in results]),
+        "optimal": np.concatenate([r[2] for r in results]),
+    }
+
+
+def analyze_production_sensitivity(
+    c=MACHINE_C,
+    A_ub=MACHINE_A_UB,
+    b_ub=MACHINE_B_UB,
+    bounds=None,
+    constraint_names=MACHINE_CONSTRAINT_NAMES,
+    maximize=True,
+):
+    """
+    求解机床生产问题并给出灵敏度分析结果
+
+    参数:
+    c, A_ub, b_ub, bounds, maximize - 含义同 solve_lp_matrix
+    constraint_names - 各约束的名称，默认为 "A机器时间约束" 等
+
+    返回:
+    字典，包含：
+    x - 最优解
+    max_profit - 最优目标值
+    c - 目标系数
+    b_ub - 约束右端项
+    shadow_prices - {约束名: 影子价格}
+    reduced_costs - 各变量的检验数（约简成本）
+    rhs_ranges - {约束名: (下限, 上限)}，右端项在此范围内变化时最优基不变
+    cost_ranges - 各变量目标系数的 (下限, 上限)，在此范围内最优解不变
+    """
+    h = build_highs_model(c, A_ub, b_ub, bounds, maximize=maximize)
+    h.run()
+    if h.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+        raise ValueError(f"模型未求得最优解: {h.modelStatusToString(h.getModelStatus())}")
+
+    solution = h.getSolution()
+    _, ranging = h.getRanging()
+    row_status = h.getBasis().row_status
+
+    rhs_ranges = {}
+    for i, name in enumerate(constraint_names):
+        if row_status[i] == highspy.HighsBasisStatus.kBasic:
+            # 非紧约束：右端项不低于当前使用量即可，最优基不变
+            rhs_ranges[name] = (solution.row_value[i], np.inf)
+        else:
+            rhs_ranges[name] = (
+                ranging.row_bound_dn.value_[i],
+                ranging.row_bound_up.value_[i],
+            )
+
+    n = len(c)
+    cost_ranges = np.column_stack(
+        [ranging.col_cost_dn.value_[:n], ranging.col_cost_up.value_[:n]]
+    )
+
+    return {
+        "x": np.array(solution.col_value),
+        "max_profit": h.getInfo().objective_function_value,
+        "c": np.asarray(c, dtype=float),
+        "b_ub": np.asarray(b_ub, dtype=float),
+        "shadow_prices": dict(zip(constraint_names, solution.row_dual)),
+        "reduced_costs": np.array(solution.col_dual),
+        "rhs_ranges": rhs_ranges,
+        "cost_ranges": cost_ranges,
+    }
+
+
+def solve_ilp_branch_and_bound(
+    c,
+    A_ub,
+    b_ub,
+    bounds=None,
+    integrality=None,
+    maximize=True,
+    gap_tol=1e-6,
+    int_tol=1e-6,
+    max_nodes=100000,
+):
+    """
+    进程内分支定界求解整数线性规划（适用于中小规模模型）
+
+    先求线性松弛得到根节点的最优基和界，之后所有节点都在同一个 HiGHS 模型上
+    只修改变量上下界，并从父节点的最优基出发用对偶单纯形法热启动。
+    节点按"最优界优先"的顺序展开，界不优于当前整数解的节点直接剪枝。
+
+    参数:
+    c, A_ub, b_ub, bounds, maximize - 含义同 solve_lp_matrix
+    integrality - 整数标记，长度为n，1表示整数变量；None表示全部为整数变量
+    gap_tol - 相对间隙小于该值时停止
+    int_tol - 判断变量取整数的容差
+    max_nodes - 最多展开的节点数
+
+    返回:
+    字典，包含：
+    x - 最优整数解
+    objective - 最优目标值
+    status - 求解状态
+    relaxation - 线性松弛的结果 {"x": ..., "objective": ...}
+    node_count - 展开的节点数
+    bound - 结束时的全局界
+    gap - 结束时的相对间隙
+    """
+    c = np.asarray(c, dtype=float)
+    n = len(c)
+    if integrality is None:
+        integrality = np.ones(n, dtype=int)
+    int_index = np.flatnonzero(integrality)
+    root_lb, root_ub = normalize_bounds(bounds, n)
+
+    h = build_highs_model(c, A_ub, b_ub, bounds, maximize=maximize)
+    h.setOptionValue("simplex_strategy", 1)  # 对偶单纯形
+    h.setOptionValue("presolve", "off")  # 保留基，便于热启动
+    col_index = np.arange(n, dtype=np.int32)
+
+    # 堆的键越小越有希望：最大化问题取目标值的相反数
+    sense = -1.0 if maximize else 1.0
+
+    def solve_node(lb, ub, basis):
+        h.changeColsBounds(n, col_index, lb, ub)
+        if basis is not None:
+            h.setBasis(basis)
+        h.run()
+        status = h.getModelStatus()
+        if status != highspy.HighsModelStatus.kOptimal:
+            return status, None, None, None
+        x = np.array(h.getSolution().col_value)
+        return status, x, h.getInfo().objective_function_value, h.getBasis()
+
+    status, x, objective, basis = solve_node(root_lb, root_ub, None)
+    if status != highspy.HighsModelStatus.kOptimal:
+        return {
+            "x": None,
+            "objective": None,
+            "status": h.modelStatusToString(status),
+            "relaxation": {"x": None, "objective": None},
+            "node_count": 1,
+            "bound": None,
+            "gap": None,
+        }
+    relaxation = {"x": x, "objective": objective}
+
+    best_x, best_objective = None, None
+    node_count = 1
+    counter = 0  # 键相同时按入堆顺序出堆
+    heap = [(sense * objective, counter, root_lb, root_ub, x, basis)]
+
+    def gap_of(key):
+        if best_objective is None:
+            return np.inf
+        return abs(sense * key - best_objective) / max(1.0, abs(best_objective))
+
+    while heap:
+        key, _, lb, ub, x, basis = heap[0]
+        if gap_of(key) <= gap_tol:
+            break
+        heapq.heappop(heap)
+        if best_objective is not None and key >= sense * best_objective:
+            continue
+
+        # 选择小数部分最接近0.5的整数变量分支
+        frac = np.abs(x[int_index] - np.round(x[int_index]))
+        if frac.size == 0 or frac.max() <= int_tol:
+            best_x, best_objective = x.copy(), sense * key
+            best_x[int_index] = np.round(best_x[int_index])
+            continue
+        j = int_index[np.argmax(frac)]
+
+        for child_lb, child_ub in (
+            (lb, np.where(col_index == j, np.floor(x[j]), ub)),
+            (np.where(col_index == j, np.ceil(x[j]), lb), ub),
+        ):
+            if node_count >= max_nodes:
+                # 子节点未探索完，父节点放回堆中，保证界覆盖其整棵子树
+                counter += 1
+                heapq.heappush(heap, (key, counter, lb, ub, x, basis))
+                break
+            node_count += 1
+            status, child_x, child_objective, child_basis = solve_node(
+                child_lb, child_ub, basis
+            )
+            if status != highspy.HighsModelStatus.kOptimal:
+                continue
+            child_key = sense * child_objective
+            if best_objective is not None and child_key >= sense * best_objective:
+                continue
+            counter += 1
+            heapq.heappush(
+                heap, (child_key, counter, child_lb, child_ub, child_x, child_basis)
+            )
+        if node_count >= max_nodes:
+            break
+
+    bound = sense * heap[0][0] if heap else best_objective
+    if best_objective is None:
+        status = "Infeasible" if not heap else "Not Solved"
+    else:
+        status = "Optimal" if gap_of(sense * bound) <= gap_tol else "Not Solved"
+
+    return {
+        "x": best_x,
+        "objective": best_objective,
+        "status": status,
+        "relaxation": relaxation,
+        "node_count": node_count,
+        "bound": bound,
+        "gap": gap_of(sense * bound) if bound is not None else None,
+    }
+
+
+def what_if_rhs(sensitivity, name, new_rhs):
+    """
+    利用灵敏度分析结果回答"某机器时数改为new_rhs后利润是多少"
+
+    参数:
+    sensitivity - analyze_production_sensitivity 的返回值
+    name - 约束名称
+    new_rhs - 新的右端项
+
+    返回:
+    新的最优利润；超出右端项范围（最优基改变）时返回 None，需要重新求解
+    """
+    low, high = sensitivity["rhs_ranges"][name]
+    if not low <= new_rhs <= high:
+        return None
+    index = list(sensitivity["rhs_ranges"]).index(name)
+    delta = new_rhs - sensitivity["b_ub"][index]
+    return sensitivity["max_profit"] + sensitivity["shadow_prices"][name] * delta
+
+
+def what_if_cost(sensitivity, j, new_cost):
+    """
+    利用灵敏度分析结果回答"第j种产品单位利润改为new_cost后利润是多少"
+
+    参数:
+    sensitivity - analyze_production_sensitivity 的返回值
+    j - 变量下标（从0开始）
+    new_cost - 新的目标系数
+
+    返回:
+    新的最优利润；超出目标系数范围（最优解改变）时返回 None，需要重新求解
+    """
+    low, high = sensitivity["cost_ranges"][j]
+    if not low <= new_cost <= high:
+        return None
+    delta = new_cost - sensitivity["c"][j]
+    return sensitivity["max_profit"] + delta * sensitivity["x"][j]
+
+
 if __name__ == "__main__":
     result = solve_machine_production()
 
+    # 矩阵形式求解，结果应与上面一致
+    result_matrix = solve_machine_production_matrix()
+    print("\n矩阵形式求解结果:")
+    for key, value in result_matrix.items():
+        print(f"{key} = {value}")
+
+    # 预处理：C机器时间约束 x2 <= 7 只含一个变量，可直接转为变量上界
+    presolved = presolve_lp(MACHINE_C, MACHINE_A_UB, MACHINE_B_UB)
+    print("\n" + format_presolve_report(presolved))
+    result_presolved = solve_lp_matrix(
+        MACHINE_C, MACHINE_A_UB, MACHINE_B_UB, presolve=True
+    )
+    print(f"预处理后求解: x = {result_presolved['x']}, 利润 = {result_presolved['objective']} 元")
+
+    # 一阶方法（PDHG）求近似解
+    result_pdhg = solve_lp_matrix(
+        MACHINE_C, MACHINE_A_UB, MACHINE_B_UB, method="pdhg", tol=1e-8
+    )
+    print(
+        f"PDHG求解: x = {result_pdhg['x']}, 利润 = {result_pdhg['objective']:.4f} 元, "
+        f"迭代 {result_pdhg['iterations']} 次"
+    )
+
+    # 场景扫描：A机器可用时数从8小时变化到12小时
+    hours_a = np.arange(8, 13)
+    rhs_table = np.column_stack(
+        [hours_a, np.full(len(hours_a), 8.0), np.full(len(hours_a), 7.0)]
+    )
+    scenarios = solve_production_scenarios(rhs_table=rhs_table, max_workers=1)
+    print("\nA机器时数扫描:")
+    for hours, x, profit in zip(hours_a, scenarios["x"], scenarios["max_profit"]):
+        print(f"A机器 {hours} 小时: 甲 = {x[0]:.2f}, 乙 = {x[1]:.2f}, 利润 = {profit:.0f} 元")
+
+    # 多进程扫描：随机的机器时数和单位利润，与单进程的结果对照
+    rng = np.random.default_rng(0)
+    n_scenarios = 2000
+    random_rhs = MACHINE_B_UB * rng.uniform(0.5, 1.5, (n_scenarios, len(MACHINE_B_UB)))
+    random_costs = MACHINE_C * rng.uniform(0.5, 1.5, (n_scenarios, len(MACHINE_C)))
+    serial = solve_production_scenarios(random_rhs, random_costs, max_workers=1)
+    parallel = solve_production_scenarios(random_rhs, random_costs, max_workers=4)
+    assert np.array_equal(serial["optimal"], parallel["optimal"])
+    assert np.allclose(serial["x"], parallel["x"], equal_nan=True)
+    assert np.allclose(serial["max_profit"], parallel["max_profit"], equal_nan=True)
+    print(
+        f"{n_scenarios} 个随机场景：4个进程与单进程的结果一致，"
+        f"最优利润 {np.nanmin(parallel['max_profit']):.0f} ~ {np.nanmax(parallel['max_profit']):.0f} 元"
+    )
+
+    # 灵敏度分析
+    sensitivity = analyze_production_sensitivity()
+    print("\n灵敏度分析:")
+    for name, price in sensitivity["shadow_prices"].items():
+        low, high = sensitivity["rhs_ranges"][name]
+        print(f"{name}: 影子价格 = {price:.0f} 元/小时, 右端项范围 = [{low}, {high}]")
+    for j, (low, high) in enumerate(sensitivity["cost_ranges"]):
+        print(f"x{j + 1} 利润系数范围 = [{low}, {high}]")
+    print(f"A机器增加1小时后的利润: {what_if_rhs(sensitivity, 'A机器时间约束', 11)} 元")
+
+    # 分支定界求整数解
+    bnb = solve_ilp_branch_and_bound(MACHINE_C, MACHINE_A_UB, MACHINE_B_UB)
+    print(
+        f"\n分支定界: x = {bnb['x']}, 利润 = {bnb['objective']} 元, "
+        f"节点数 = {bnb['node_count']}, 间隙 = {bnb['gap']}"
+    )
+
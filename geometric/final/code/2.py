@@ -6,15 +6,20 @@
 """
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import odeint
-from matplotlib.animation import FuncAnimation
+from scipy.integrate import solve_ivp, RK45
+from scipy.optimize import brentq
+from scipy.spatial import cKDTree
+from matplotlib.animation import FuncAnimation, FFMpegWriter, PillowWriter, writers
+from matplotlib.collections import LineCollection
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import os
+import tempfile
 
 plt.rcParams["font.sans-serif"] = ["SimHei"]  # 使用SimHei字体
 plt.rcParams["axes.unicode_minus"] = False
 
 
-def dog_rabbit_model(state, t, v_rabbit=10):
+def dog_rabbit_model(state, t, v_rabbit=10, speed_ratio=2.0):
     """
     猎犬追兔子的微分方程模型
 
@@ -22,6 +27,7 @@ def dog_rabbit_model(state, t, v_rabbit=10):
     state - 状态向量 [猎犬x坐标, 猎犬y坐标]
     t - 时间点
     v_rabbit - 兔子的速度，默认10m/s
+    speed_ratio - 猎犬与兔子的速度比，默认2
 
     返回:
     猎犬位置的导数 [dx/dt, dy/dt]
@@ -43,8 +49,8 @@ def dog_rabbit_model(state, t, v_rabbit=10):
     if distance <= 0.0:
         return [0, 0]
 
-    # 猎犬的速度是兔子的2倍
-    v_dog = 2 * v_rabbit
+    # 猎犬的速度是兔子的 speed_ratio 倍（默认2倍）
+    v_dog = speed_ratio * v_rabbit
 
     # 计算猎犬的速度分量
     dx_dt = v_dog * dx / distance
@@ -53,65 +59,961 @@ def dog_rabbit_model(state, t, v_rabbit=10):
     return [dx_dt, dy_dt]
 
 
-def solve_hunting_problem(v_rabbit=10.0, t_max=15.0):
+def catch_event(v_rabbit, catch_radius=1e-6):
+    """
+    构造追上事件：猎犬与兔子的距离减小到 catch_radius 时事件触发并终止积分
+
+    参数:
+    v_rabbit - 兔子的速度
+    catch_radius - 判定追上的距离
+
+    返回:
+    供 solve_ivp 使用的事件函数
+    """
+
+    def event(t, state):
+        y_rabbit = min(v_rabbit * t, 100)
+        return np.hypot(100 - state[0], y_rabbit - state[1]) - catch_radius
+
+    event.terminal = True
+    event.direction = -1
+    return event
+
+
+def pursuit_closed_form(v_rabbit, speed_ratio=2.0, distance=100.0):
+    """
+    经典追击问题的解析解：兔子从 (distance, 0) 沿直线 x = distance 匀速向上跑，
+    猎犬从原点出发、速度为兔子的 k 倍（k > 1）且始终朝向兔子
+
+    记 u = 1 - x/d，追击曲线为
+        y(u) = d/2 * [u^(1+1/k)/(1+1/k) - u^(1-1/k)/(1-1/k)] + d*k/(k^2-1)
+    猎犬的切线始终经过兔子，因此 v*t = y + d*u*y'(x)，其中 y'(x) = (u^(-1/k) - u^(1/k))/2
+
+    参数:
+    v_rabbit - 兔子的速度
+    speed_ratio - 速度比 k，需大于1
+    distance - 猎犬与兔子奔跑路线的距离 d
+
+    返回:
+    catch_time - 追上的时间 d*k/((k^2-1)*v)
+    catch_position - 追上的位置 (d, d*k/(k^2-1))
+    """
+    k = speed_ratio
+    catch_y = distance * k / (k**2 - 1)
+    return catch_y / v_rabbit, np.array([distance, catch_y])
+
+
+def pursuit_closed_form_position(t, v_rabbit, speed_ratio=2.0, distance=100.0):
+    """
+    用解析解计算任意时刻猎犬的位置（t 超过追上时间时取追上位置）
+
+    时间 t(u) 关于 u 单调，按时间取点时对 u 做向量化二分求逆
+
+    参数:
+    t - 时间点数组
+    v_rabbit, speed_ratio, distance - 含义同 pursuit_closed_form
+
+    返回:
+    猎犬位置，形状 (len(t), 2)
+    """
+    k, d = speed_ratio, distance
+    t = np.asarray(t, dtype=float)
+
+    def curve_y(u):
+        return d / 2 * (u ** (1 + 1 / k) / (1 + 1 / k) - u ** (1 - 1 / k) / (1 - 1 / k)) + d * k / (k**2 - 1)
+
+    def curve_t(u):
+        return (curve_y(u) + d * u * (u ** (-1 / k) - u ** (1 / k)) / 2) / v_rabbit
+
+    # u 从1（出发）减小到0（追上），t(u) 单调递减
+    lo, hi = np.zeros_like(t), np.ones_like(t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            later = curve_t(mid) < t
+            hi = np.where(later, mid, hi)
+            lo = np.where(later, lo, mid)
+    u = (lo + hi) / 2
+    return np.column_stack([d * (1 - u), curve_y(u)])
+
+
+class PursuitTrajectory:
+    """
+    猎犬追兔子的轨迹
+
+    只保存求解器的稠密输出插值（解析解时只保存参数），不预先生成固定网格上的位置数组，
+    内存随积分步数增长；需要位置时再按任意时刻或分辨率计算
+
+    属性:
+    v_rabbit - 兔子的速度
+    speed_ratio - 猎犬与兔子的速度比
+    t_end - 轨迹结束时间（追上时刻，未追上时为t_max）
+    catch_time - 追上兔子的时间（未追上为None）
+    catch_position - 追上兔子的位置（未追上为None）
+    """
+
+    def __init__(self, v_rabbit, speed_ratio, t_end, catch_time, catch_position, interpolant=None):
+        self.v_rabbit = v_rabbit
+        self.speed_ratio = speed_ratio
+        self.t_end = t_end
+        self.catch_time = catch_time
+        self.catch_position = catch_position
+        # solve_ivp 的稠密输出（OdeSolution）；为None时用解析解
+        self._interpolant = interpolant
+
+    def dog_position(self, t):
+        """
+        计算猎犬在时刻 t 的位置（t 超出轨迹范围时截断到端点）
+
+        参数:
+        t - 时间点数组
+
+        返回:
+        猎犬位置，形状 (len(t), 2)
+        """
+        t = np.clip(np.atleast_1d(np.asarray(t, dtype=float)), 0, self.t_end)
+        if self._interpolant is None:
+            return pursuit_closed_form_position(t, self.v_rabbit, self.speed_ratio)
+        return self._interpolant(t).T
+
+    def rabbit_position(self, t):
+        """
+        计算兔子在时刻 t 的位置
+
+        参数:
+        t - 时间点数组
+
+        返回:
+        兔子位置，形状 (len(t), 2)
+        """
+        t = np.clip(np.atleast_1d(np.asarray(t, dtype=float)), 0, self.t_end)
+        return np.column_stack([np.full(len(t), 100.0), np.minimum(self.v_rabbit * t, 100)])
+
+    def sample(self, n_points=1000, t_end=None):
+        """
+        在 [0, t_end] 上均匀取点计算两者位置
+
+        参数:
+        n_points - 采样点数
+        t_end - 采样结束时间，默认到轨迹结束（追上时刻）
+
+        返回:
+        t - 时间点
+        dog_positions - 猎犬位置
+        rabbit_positions - 兔子位置
+        """
+        t = np.linspace(0, self.t_end if t_end is None else min(t_end, self.t_end), n_points)
+        return t, self.dog_position(t), self.rabbit_position(t)
+
+
+def solve_hunting_closed_form(v_rabbit=10.0, speed_ratio=2.0):
+    """
+    不做数值积分，直接用解析解求猎犬追兔子问题（兔子不受洞穴限制）
+
+    参数:
+    v_rabbit - 兔子的速度
+    speed_ratio - 猎犬与兔子的速度比，需大于1
+
+    返回:
+    PursuitTrajectory 轨迹对象
+    """
+    catch_time, catch_position = pursuit_closed_form(v_rabbit, speed_ratio)
+    return PursuitTrajectory(v_rabbit, speed_ratio, catch_time, catch_time, catch_position)
+
+
+def solve_hunting_problem(
+    v_rabbit=10.0,
+    t_max=15.0,
+    rtol=1e-10,
+    atol=1e-10,
+    speed_ratio=2.0,
+    method="auto",
+):
     """
     求解猎犬追兔子问题
 
     参数:
     v_rabbit - 兔子的速度，默认10m/s
     t_max - 最大模拟时间，默认15秒
+    rtol, atol - 积分的相对、绝对容差
+    speed_ratio - 猎犬与兔子的速度比，默认2
+    method - "auto"（在洞穴前、t_max 内能追上时用解析解，否则数值积分）、
+             "closed_form" 或 "numerical"
 
     返回:
-    t - 时间点
-    solution - 猎犬位置随时间变化
-    rabbit_positions - 兔子位置随时间变化
-    catch_time - 追上兔子的时间
-    catch_position - 追上兔子的位置
+    PursuitTrajectory 轨迹对象，catch_time、catch_position 为追上的时间和位置，
+    位置数组需要时再用 sample / dog_position 计算
     """
+    if method == "closed_form":
+        return solve_hunting_closed_form(v_rabbit, speed_ratio)
+    if method == "auto" and speed_ratio > 1:
+        # 追上位置不超过洞穴时，兔子的 min(v*t, 100) 限制不起作用，解析解就是精确解
+        catch_time, catch_position = pursuit_closed_form(v_rabbit, speed_ratio)
+        if catch_position[1] <= 100 and catch_time <= t_max:
+            return solve_hunting_closed_form(v_rabbit, speed_ratio)
+
     # 初始条件: 猎犬在原点(0,0)
     initial_state = [0, 0]
 
-    # 时间点
-    t = np.linspace(0, t_max, 1000)
+    # 求解微分方程，距离降到阈值时由事件函数求根得到追上时刻并立即停止
+    result = solve_ivp(
+        lambda t, state: dog_rabbit_model(state, t, v_rabbit, speed_ratio),
+        (0, t_max),
+        initial_state,
+        events=catch_event(v_rabbit),
+        dense_output=True,
+        rtol=rtol,
+        atol=atol,
+    )
 
-    # 求解微分方程
-    solution = odeint(dog_rabbit_model, initial_state, t, args=(v_rabbit,))
+    if result.t_events[0].size:
+        catch_time = result.t_events[0][0]
+        catch_position = result.y_events[0][0]
+    else:
+        catch_time = None
+        catch_position = None
 
-    # 计算每个时间点兔子的位置
-    rabbit_positions = np.zeros((len(t), 2))
-    rabbit_positions[:, 0] = 100  # x坐标固定为100
-    rabbit_positions[:, 1] = np.minimum(v_rabbit * t, 100)  # y坐标随时间变化，不超过100
+    return PursuitTrajectory(
+        v_rabbit, speed_ratio, result.t[-1], catch_time, catch_position, result.sol
+    )
 
-    # 确定追上兔子的时间和位置
-    distances = np.sqrt(np.sum((solution - rabbit_positions) ** 2, axis=1))
-    catch_index = np.argmin(distances)
 
-    # 如果最小距离仍然较大，则可能没有在模拟时间内追上
-    if distances[catch_index] > 0.5:
-        # 尝试更精确地计算追上时间
-        for i in range(len(t) - 1):
-            if distances[i + 1] < 0.5:
-                catch_index = i + 1
-                break
+SENSITIVITY_PARAMS = ("v_rabbit", "speed_ratio", "start_x", "start_y")
 
-    catch_time = t[catch_index]
-    catch_position = solution[catch_index]
 
-    return t, solution, rabbit_positions, catch_time, catch_position
+def solve_hunting_sensitivity(
+    v_rabbit=10.0,
+    speed_ratio=2.0,
+    dog_start=(0.0, 0.0),
+    t_max=15.0,
+    catch_radius=1e-6,
+    rtol=1e-10,
+    atol=1e-10,
+):
+    """
+    前向灵敏度法：一次积分同时得到追上时间、追上位置对参数的导数
 
+    记猎犬位置 z，参数 p = (v, k, x0, y0)，兔子位置 r(t) = (100, min(v*t, 100))，
+    δ = r - z，d = |δ|，u = δ/d，则 dz/dt = f = k*v*u，
+    灵敏度 S = dz/dp (2x4) 满足 dS/dt = ∂f/∂z S + ∂f/∂p，S(0) = [0, 0, I]，其中
+        ∂f/∂z = -k*v*(I - u u^T)/d
+        ∂f/∂v = k*u + k*v*(I - u u^T)/d * ∂r/∂v，∂r/∂v = (0, t)（兔子到洞穴前）
+        ∂f/∂k = v*u
+    追上时刻 T 由 g = d - catch_radius = 0 确定，由隐函数定理
+        dT/dp = -(∂g/∂z S + ∂g/∂p) / (dg/dt)，∂g/∂z = -u^T，∂g/∂p = u^T ∂r/∂p
+        d z(T)/dp = S(T) + f(T) dT/dp
 
-def plot_trajectories(t, dog_positions, rabbit_positions, catch_time, catch_position):
-    """绘制猎犬和兔子的运动轨迹"""
+    参数:
+    v_rabbit - 兔子的速度
+    speed_ratio - 猎犬与兔子的速度比
+    dog_start - 猎犬起点
+    t_max - 最大模拟时间
+    catch_radius - 判定追上的距离
+    rtol, atol - 积分的相对、绝对容差
+
+    返回:
+    字典，包含（未追上时 catch_time 为None，导数为nan）：
+    catch_time - 追上的时间
+    catch_position - 追上的位置
+    params - 参数名，顺序同 SENSITIVITY_PARAMS
+    d_catch_time - 追上时间对各参数的导数，形状 (4,)
+    d_catch_position - 追上位置对各参数的导数，形状 (2, 4)
+    """
+    v, k = float(v_rabbit), float(speed_ratio)
+
+    def rabbit(t):
+        running = v * t < 100
+        return np.array([100.0, min(v * t, 100)]), running
+
+    def geometry(t, z):
+        r, running = rabbit(t)
+        delta = r - z
+        d = np.hypot(*delta)
+        u = delta / d
+        dr_dv = np.array([0.0, t]) if running else np.zeros(2)
+        return u, d, dr_dv, running
+
+    def rhs(t, w):
+        z, S = w[:2], w[2:].reshape(2, 4)
+        u, d, dr_dv, _ = geometry(t, z)
+        projector = (np.eye(2) - np.outer(u, u)) / d
+        df_dp = np.zeros((2, 4))
+        df_dp[:, 0] = k * u + k * v * projector @ dr_dv
+        df_dp[:, 1] = v * u
+        dS = -k * v * projector @ S + df_dp
+        return np.concatenate([k * v * u, dS.ravel()])
+
+    def event(t, w):
+        return geometry(t, w[:2])[1] - catch_radius
+
+    event.terminal = True
+    event.direction = -1
+
+    S0 = np.zeros((2, 4))
+    S0[:, 2:] = np.eye(2)
+    w0 = np.concatenate([np.asarray(dog_start, dtype=float), S0.ravel()])
+    result = solve_ivp(rhs, (0, t_max), w0, events=event, rtol=rtol, atol=atol)
+
+    if not result.t_events[0].size:
+        return {
+            "catch_time": None,
+            "catch_position": None,
+            "params": SENSITIVITY_PARAMS,
+            "d_catch_time": np.full(4, np.nan),
+            "d_catch_position": np.full((2, 4), np.nan),
+        }
+
+    T = result.t_events[0][0]
+    w = result.y_events[0][0]
+    z, S = w[:2], w[2:].reshape(2, 4)
+    u, _, dr_dv, running = geometry(T, z)
+    f = k * v * u
+    r_dot = np.array([0.0, v]) if running else np.zeros(2)
+    dg_dp = -u @ S
+    dg_dp[0] += u @ dr_dv
+    d_catch_time = -dg_dp / (u @ (r_dot - f))
+
+    return {
+        "catch_time": T,
+        "catch_position": z,
+        "params": SENSITIVITY_PARAMS,
+        "d_catch_time": d_catch_time,
+        "d_catch_position": S + np.outer(f, d_catch_time),
+    }
+
+
+def stream_hunting_problem(
+    v_rabbit=10.0,
+    speed_ratio=2.0,
+    dt=0.01,
+    chunk_size=256,
+    t_max=np.inf,
+    catch_radius=1e-6,
+    rtol=1e-10,
+    atol=1e-10,
+):
+    """
+    边积分边输出的猎犬追兔子求解器（生成器）
+
+    自适应步长的求解器每走一步，就用该步的稠密输出在间隔 dt 的时刻上取点，
+    攒满 chunk_size 个点后输出一块。只保存当前一步和一块缓冲区，
+    内存与模拟时长无关；追上兔子时输出最后一块（以追上时刻结尾）后停止，
+    积分失败时输出已算出的剩余点后停止，调用方不再取数据时积分也随之停止。
+
+    参数:
+    v_rabbit - 兔子的速度
+    speed_ratio - 猎犬与兔子的速度比
+    dt - 输出的时间间隔
+    chunk_size - 每块的点数
+    t_max - 最大模拟时间，默认不限
+    catch_radius - 判定追上的距离
+    rtol, atol - 积分的相对、绝对容差
+
+    输出:
+    每次输出一个元组 (t, hound_pos, rabbit_pos, distance)，
+    形状分别为 (k,)、(k, 2)、(k, 2)、(k,)，除最后一块外 k = chunk_size
+
+    返回:
+    追上兔子的时间（生成器结束时 StopIteration.value；未追上为None）
+    """
+
+    # 整数 dt 会让输出的时间数组变成整数类型
+    dt = float(dt)
+
+    def rabbit_at(t):
+        t = np.atleast_1d(t)
+        return np.column_stack([np.full(len(t), 100.0), np.minimum(v_rabbit * t, 100)])
+
+    solver = RK45(
+        lambda t, state: dog_rabbit_model(state, t, v_rabbit, speed_ratio),
+        0.0,
+        [0.0, 0.0],
+        t_max,
+        rtol=rtol,
+        atol=atol,
+    )
+
+    def emit(times, dense):
+        hound = dense(times).T
+        rabbit = rabbit_at(times)
+        delta = rabbit - hound
+        return times, hound, rabbit, np.hypot(delta[:, 0], delta[:, 1])
+
+    buffer = []
+    buffered = 0
+    next_index = 0  # 下一个输出时刻为 next_index * dt
+    catch_time = None
+    while solver.status == "running":
+        t_old = solver.t
+        solver.step()
+        if solver.status == "failed":
+            break
+        dense = solver.dense_output()
+
+        # 距离降到 catch_radius 以下时，在这一步内求根得到追上时刻
+        def gap(t):
+            return np.hypot(*(rabbit_at(t)[0] - dense(t))) - catch_radius
+
+        t_stop = solver.t
+        if gap(solver.t) <= 0:
+            catch_time = brentq(gap, t_old, solver.t, xtol=1e-14)
+            t_stop = catch_time
+
+        last_index = int(np.floor(t_stop / dt + 1e-12))
+        times = np.arange(next_index, last_index + 1) * dt
+        next_index = last_index + 1
+        if catch_time is not None and (times.size == 0 or times[-1] < catch_time):
+            times = np.append(times, catch_time)
+
+        if times.size:
+            buffer.append(emit(times, dense))
+            buffered += times.size
+        while buffered >= chunk_size or (buffered and (catch_time is not None or solver.status != "running")):
+            parts = [np.concatenate(arrays) for arrays in zip(*buffer)]
+            chunk = tuple(part[:chunk_size] for part in parts)
+            rest = tuple(part[chunk_size:] for part in parts)
+            buffered = len(rest[0])
+            buffer = [rest] if buffered else []
+            yield chunk
+
+        if catch_time is not None:
+            return catch_time
+
+    # 积分失败时，缓冲区中已算出的点仍然输出
+    if buffered:
+        yield tuple(np.concatenate(arrays) for arrays in zip(*buffer))
+    return catch_time
+
+
+# Dormand-Prince 5(4) 的 Butcher 表
+DP_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+# 5阶解与4阶解系数之差，用于误差估计
+DP_E = np.array(
+    [71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40]
+)
+
+
+def rabbit_position_batch(t, v_rabbit, rabbit_x=100.0, burrow_y=100.0):
+    """
+    批量计算兔子位置
+
+    参数:
+    t - 时间，形状 (N,)
+    v_rabbit - 兔子速度，形状 (N,)
+    rabbit_x - 兔子奔跑路线的x坐标，标量或形状 (N,)
+    burrow_y - 洞穴的y坐标，标量或形状 (N,)
+
+    返回:
+    兔子位置，形状 (N, 2)
+    """
+    return np.column_stack(
+        [np.broadcast_to(rabbit_x, len(t)), np.minimum(v_rabbit * t, burrow_y)]
+    )
+
+
+def dog_rabbit_model_batch(t, state, v_rabbit, speed_ratio, rabbit_x=100.0, burrow_y=100.0):
+    """
+    向量化的猎犬追兔子模型，同时计算N个场景的导数
+
+    参数:
+    t - 时间，形状 (N,)
+    state - 猎犬位置，形状 (N, 2)
+    v_rabbit - 兔子速度，形状 (N,)
+    speed_ratio - 猎犬与兔子的速度比，形状 (N,)
+    rabbit_x, burrow_y - 含义同 rabbit_position_batch
+
+    返回:
+    猎犬位置的导数，形状 (N, 2)
+    """
+    delta = rabbit_position_batch(t, v_rabbit, rabbit_x, burrow_y) - state
+    distance = np.hypot(delta[:, 0], delta[:, 1])
+    # 距离为0时已经追上，导数取0
+    scale = np.where(distance > 0, speed_ratio * v_rabbit / np.where(distance > 0, distance, 1), 0)
+    return delta * scale[:, None]
+
+
+def solve_hunting_batch(
+    v_rabbit,
+    speed_ratio=2.0,
+    dog_start=(0.0, 0.0),
+    t_max=15.0,
+    rabbit_x=100.0,
+    burrow_y=100.0,
+    rtol=1e-8,
+    atol=1e-8,
+    catch_radius=1e-6,
+    max_steps=100000,
+):
+    """
+    批量求解猎犬追兔子问题：所有场景叠成一个 (N, 2) 的状态数组，
+    用自适应步长的 Dormand-Prince 5(4) 方法同时推进，每个场景有各自的步长，
+    追上或到达 t_max 的场景被屏蔽，不再参与后续计算
+
+    参数:
+    v_rabbit - 兔子速度，标量或形状 (N,)
+    speed_ratio - 猎犬与兔子的速度比，标量或形状 (N,)
+    dog_start - 猎犬起点，形状 (2,) 或 (N, 2)
+    t_max - 最大模拟时间
+    rabbit_x, burrow_y - 兔子奔跑路线的x坐标和洞穴的y坐标（兔子从 (rabbit_x, 0) 出发），
+                         标量或形状 (N,)
+    rtol, atol - 每步的相对、绝对误差容限
+    catch_radius - 判定追上的距离
+    max_steps - 最大步数（含被拒绝的步）
+
+    返回:
+    字典，包含：
+    caught - 是否在 t_max 内追上，形状 (N,)
+    escaped - 兔子是否在被追上（未追上时为模拟结束）之前已经到达洞穴，形状 (N,)
+    catch_time - 追上的时间（未追上为nan），形状 (N,)
+    catch_position - 追上的位置（未追上为nan），形状 (N, 2)
+    final_position - 结束时猎犬的位置，形状 (N, 2)
+    steps - 每个场景接受的步数，形状 (N,)
+    """
+    v_rabbit, speed_ratio, rabbit_x, burrow_y = (
+        a.ravel()
+        for a in np.broadcast_arrays(
+            *(np.asarray(a, dtype=float) for a in (v_rabbit, speed_ratio, rabbit_x, burrow_y))
+        )
+    )
+    dog_start = np.asarray(dog_start, dtype=float).reshape(-1, 2)
+    n = max(len(v_rabbit), len(dog_start))
+    v_rabbit, speed_ratio, rabbit_x, burrow_y = (
+        np.broadcast_to(a, n).copy() for a in (v_rabbit, speed_ratio, rabbit_x, burrow_y)
+    )
+    y = np.broadcast_to(dog_start, (n, 2)).copy()
+
+    def rhs(t, state, idx):
+        return dog_rabbit_model_batch(
+            t, state, v_rabbit[idx], speed_ratio[idx], rabbit_x[idx], burrow_y[idx]
+        )
+
+    def gap(t, state, idx):
+        delta = rabbit_position_batch(t, v_rabbit[idx], rabbit_x[idx], burrow_y[idx]) - state
+        return np.hypot(delta[:, 0], delta[:, 1])
+
+    t = np.zeros(n)
+    v_dog = speed_ratio * v_rabbit
+    distance = gap(t, y, np.arange(n))
+    h = np.maximum(0.01 * distance / np.maximum(v_dog, 1e-12), 1e-6)
+    caught = distance <= catch_radius
+    active = ~caught
+    steps = np.zeros(n, dtype=int)
+    f = rhs(t, y, np.arange(n))
+
+    for _ in range(max_steps):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        ti, yi, fi = t[idx], y[idx], f[idx]
+        # 步长不超过 t_max，也不让猎犬一步越过兔子（相对接近速度不超过 (k+1)v）
+        hi = np.minimum(h[idx], t_max - ti)
+        hi = np.minimum(hi, (distance[idx] - 0.5 * catch_radius) / ((speed_ratio[idx] + 1) * v_rabbit[idx]))
+
+        k = [fi]
+        for stage in range(1, 7):
+            y_stage = yi + hi[:, None] * sum(a * k[j] for j, a in enumerate(DP_A[stage]))
+            k.append(rhs(ti + DP_C[stage] * hi, y_stage, idx))
+        y_new = y_stage  # 第7级的节点就是5阶解（FSAL）
+        err = hi[:, None] * sum(e * kj for e, kj in zip(DP_E, k))
+        scale = atol + rtol * np.maximum(np.abs(yi), np.abs(y_new))
+        err_norm = np.sqrt(np.mean((err / scale) ** 2, axis=1))
+        accept = err_norm <= 1
+
+        # 接受的步：更新状态；所有步：调整步长
+        good = idx[accept]
+        t[good] += hi[accept]
+        y[good] = y_new[accept]
+        f[good] = k[6][accept]
+        steps[good] += 1
+        with np.errstate(divide="ignore"):
+            factor = np.clip(0.9 * err_norm ** -0.2, 0.2, 5.0)
+        h[idx] = hi * np.where(accept, factor, np.minimum(factor, 1.0))
+
+        distance[good] = gap(t[good], y[good], good)
+        caught[good] = distance[good] <= catch_radius
+        active[good] = ~caught[good] & (t[good] < t_max)
+
+    catch_time = np.where(caught, t, np.nan)
+    catch_position = np.where(caught[:, None], y, np.nan)
+    # 兔子到达洞穴的时刻；追上的场景 t 即追上时刻，未追上的场景 t 为模拟结束时刻
+    with np.errstate(divide="ignore"):
+        arrival = np.where(v_rabbit > 0, burrow_y / v_rabbit, np.inf)
+    return {
+        "caught": caught,
+        "escaped": arrival <= t,
+        "catch_time": catch_time,
+        "catch_position": catch_position,
+        "final_position": y,
+        "steps": steps,
+    }
+
+
+def _target_positions(t, starts, goals, speeds):
+    """
+    计算各目标在时刻 t 的位置：从起点沿直线匀速跑向终点（洞穴），到达后停下
+
+    参数:
+    t - 时间（标量）
+    starts, goals - 起点和终点，形状 (M, 2)
+    speeds - 速度，形状 (M,)
+
+    返回:
+    位置，形状 (M, 2)；是否已到达终点，形状 (M,)
+    """
+    delta = goals - starts
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    travelled = np.minimum(speeds * t, length)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        direction = np.where(length[:, None] > 0, delta / length[:, None], 0.0)
+    return starts + direction * travelled[:, None], speeds * t >= length
+
+
+def _unit(delta):
+    """把位移向量单位化（零向量保持为零）"""
+    norm = np.hypot(delta[:, 0], delta[:, 1])
+    return delta / np.where(norm > 0, norm, 1)[:, None], norm
+
+
+def simulate_pack_pursuit(
+    pursuers,
+    pursuer_speeds,
+    targets,
+    target_goals,
+    target_speeds,
+    dt=0.01,
+    t_max=60.0,
+    capture_radius=0.5,
+    assignment="nearest",
+    initial_assignment=None,
+    safe_at_goal=True,
+    record_every=None,
+):
+    """
+    N 只猎犬追 M 只兔子的多智能体追击模拟
+
+    所有智能体的位置都存放在 NumPy 数组中，每一步：
+    1. 为每只猎犬分配目标（"nearest"：用 KD 树找最近的未被捕获目标；
+       "fixed"：按 initial_assignment 追击，目标被捕获或逃脱后改追最近的目标）
+    2. 所有猎犬同时朝各自目标移动（中点法，步内目标分配不变）
+    3. 一步之内能够追上（距离不超过 速度*dt + capture_radius）的猎犬-目标对被批量判定为捕获，
+       对应目标一起移除
+    每步的计算量为 O((N + M) log M)，可以一次模拟成千上万个智能体
+
+    参数:
+    pursuers - 猎犬起点，形状 (N, 2)
+    pursuer_speeds - 猎犬速度，标量或形状 (N,)
+    targets - 兔子起点，形状 (M, 2)
+    target_goals - 兔子的洞穴位置，形状 (M, 2) 或 (2,)
+    target_speeds - 兔子速度，标量或形状 (M,)
+    dt - 时间步长（捕获时间的精度约为 dt）
+    t_max - 最大模拟时间
+    capture_radius - 判定捕获的距离
+    assignment - 目标分配规则，"nearest" 或 "fixed"
+    initial_assignment - "fixed" 规则下每只猎犬追击的兔子编号，形状 (N,)
+    safe_at_goal - 兔子到达洞穴后是否算作逃脱（不能再被捕获）
+    record_every - 每隔多少步记录一次所有猎犬的位置，None 表示不记录
+
+    返回:
+    字典，包含：
+    capture_time - 每只兔子被捕获的时间（未被捕获为nan），形状 (M,)
+    captured_by - 捕获该兔子的猎犬编号（未被捕获为-1），形状 (M,)
+    capture_position - 捕获位置，形状 (M, 2)
+    escaped - 兔子是否逃进洞穴，形状 (M,)
+    pursuer_positions - 结束时猎犬的位置，形状 (N, 2)
+    t - 结束时间
+    history_t, history - 记录的时刻和猎犬位置，形状 (K,) 和 (K, N, 2)（未记录时为None）
+    """
+    p = np.array(pursuers, dtype=float).reshape(-1, 2)
+    starts = np.array(targets, dtype=float).reshape(-1, 2)
+    n, m = len(p), len(starts)
+    goals = np.broadcast_to(np.asarray(target_goals, dtype=float), (m, 2))
+    p_speed = np.broadcast_to(np.asarray(pursuer_speeds, dtype=float), n)
+    t_speed = np.broadcast_to(np.asarray(target_speeds, dtype=float), m)
+    if assignment == "fixed":
+        if initial_assignment is None:
+            raise ValueError('assignment="fixed" 需要给出 initial_assignment')
+        chase = np.asarray(initial_assignment, dtype=int).copy()
+    elif assignment == "nearest":
+        chase = np.zeros(n, dtype=int)
+    else:
+        raise ValueError(f"未知的目标分配规则: {assignment}")
+
+    alive = np.ones(m, dtype=bool)
+    escaped = np.zeros(m, dtype=bool)
+    capture_time = np.full(m, np.nan)
+    captured_by = np.full(m, -1)
+    capture_position = np.full((m, 2), np.nan)
+    history_t, history = ([], []) if record_every else (None, None)
+
+    t = 0.0
+    step = 0
+    while t < t_max and alive.any():
+        if record_every and step % record_every == 0:
+            history_t.append(t)
+            history.append(p.copy())
+
+        # 1. 分配目标
+        q, _ = _target_positions(t, starts, goals, t_speed)
+        alive_index = np.flatnonzero(alive)
+        if assignment == "nearest":
+            _, nearest = cKDTree(q[alive_index]).query(p)
+            chase = alive_index[nearest]
+        else:
+            lost = ~alive[chase]
+            if lost.any():
+                _, nearest = cKDTree(q[alive_index]).query(p[lost])
+                chase[lost] = alive_index[nearest]
+
+        # 2. 中点法推进所有猎犬
+        q_mid, _ = _target_positions(t + dt / 2, starts, goals, t_speed)
+        q_end, at_goal = _target_positions(t + dt, starts, goals, t_speed)
+        direction, _ = _unit(q[chase] - p)
+        p_mid = p + 0.5 * dt * p_speed[:, None] * direction
+        direction, _ = _unit(q_mid[chase] - p_mid)
+        _, reach = _unit(q_end[chase] - p)
+        p = p + dt * p_speed[:, None] * direction
+        t += dt
+        step += 1
+
+        # 3. 批量判定捕获：同一只兔子被多只猎犬追上时记给编号最小的猎犬
+        hit = np.flatnonzero(reach <= p_speed * dt + capture_radius)
+        if hit.size:
+            victims, first = np.unique(chase[hit], return_index=True)
+            hunters = hit[first]
+            capture_time[victims] = t
+            captured_by[victims] = hunters
+            capture_position[victims] = q_end[victims]
+            alive[victims] = False
+            # 一步之内能追上的猎犬停在兔子的位置
+            p[hit] = q_end[chase[hit]]
+
+        if safe_at_goal:
+            safe = alive & at_goal
+            escaped |= safe
+            alive &= ~safe
+
+    return {
+        "capture_time": capture_time,
+        "captured_by": captured_by,
+        "capture_position": capture_position,
+        "escaped": escaped,
+        "pursuer_positions": p,
+        "t": t,
+        "history_t": None if history_t is None else np.array(history_t),
+        "history": None if history is None else np.array(history),
+    }
+
+
+# 参数扫描缓存的记录格式：前6列是参数（作为键），其余是结果
+SWEEP_KEYS = ("v_rabbit", "speed_ratio", "burrow_y", "start_x", "start_y", "t_max")
+SWEEP_DTYPE = np.dtype(
+    [(name, "f8") for name in SWEEP_KEYS]
+    + [
+        ("catch_time", "f8"),
+        ("catch_x", "f8"),
+        ("catch_y", "f8"),
+        ("escaped", "?"),
+        ("done", "?"),
+    ]
+)
+
+
+def _sweep_chunk(params):
+    """
+    在一个工作进程中批量积分一段扫描点
+
+    参数:
+    params - 形状 (k, 6) 的参数数组，列的顺序同 SWEEP_KEYS
+
+    返回:
+    catch_time, catch_position, escaped - 含义同 solve_hunting_batch
+    """
+    v_rabbit, speed_ratio, burrow_y, start_x, start_y, t_max = params.T
+    # 各点的 t_max 可能不同：按最大值积分，再把超过各自 t_max 的追上视为未追上
+    result = solve_hunting_batch(
+        v_rabbit,
+        speed_ratio,
+        np.column_stack([start_x, start_y]),
+        t_max=t_max.max(),
+        burrow_y=burrow_y,
+    )
+    late = ~(result["catch_time"] <= t_max)
+    catch_time = np.where(late, np.nan, result["catch_time"])
+    catch_position = np.where(late[:, None], np.nan, result["catch_position"])
+    # 兔子还须在各自的 t_max 之前到达洞穴
+    with np.errstate(divide="ignore"):
+        arrival = np.where(v_rabbit > 0, burrow_y / v_rabbit, np.inf)
+    return catch_time, catch_position, result["escaped"] & (arrival <= t_max)
+
+
+def _open_sweep_cache(cache_path, keys):
+    """
+    打开（必要时创建或扩充）参数扫描的磁盘缓存
+
+    参数:
+    cache_path - .npy 缓存文件路径
+    keys - 本次需要的参数，形状 (N, 6)
+
+    返回:
+    records - 以读写方式打开的内存映射结构化数组
+    index - 本次每个参数点在 records 中的下标，形状 (N,)
+    """
+    if os.path.exists(cache_path):
+        old = np.lib.format.open_memmap(cache_path, mode="r")
+        old_keys = np.column_stack([old[name] for name in SWEEP_KEYS])
+    else:
+        old = None
+        old_keys = np.zeros((0, len(SWEEP_KEYS)))
+
+    # 按参数值匹配已有记录，没有的追加到末尾
+    all_keys, first, inverse = np.unique(
+        np.vstack([old_keys, keys]), axis=0, return_index=True, return_inverse=True
+    )
+    inverse = inverse.ravel()
+    new_rows = np.sort(first[first >= len(old_keys)])
+    if new_rows.size:
+        path_tmp = cache_path + ".tmp.npy"
+        grown = np.lib.format.open_memmap(
+            path_tmp, mode="w+", dtype=SWEEP_DTYPE, shape=(len(old_keys) + new_rows.size,)
+        )
+        if old is not None:
+            grown[: len(old_keys)] = old
+        added = grown[len(old_keys) :]
+        for j, name in enumerate(SWEEP_KEYS):
+            added[name] = np.vstack([old_keys, keys])[new_rows, j]
+        added["catch_time"] = np.nan
+        added["catch_x"] = np.nan
+        added["catch_y"] = np.nan
+        added["escaped"] = False
+        added["done"] = False
+        grown.flush()
+        del grown, added, old
+        os.replace(path_tmp, cache_path)
+    else:
+        del old
+
+    # 唯一参数值 -> 记录下标
+    position = np.empty(len(all_keys), dtype=int)
+    old_count = len(old_keys)
+    position[inverse[:old_count]] = np.arange(old_count)
+    position[inverse[new_rows]] = old_count + np.arange(new_rows.size)
+    records = np.lib.format.open_memmap(cache_path, mode="r+")
+    return records, position[inverse[old_count:]]
+
+
+def sweep_pursuit(
+    cache_path,
+    v_rabbit=(10.0,),
+    speed_ratio=(2.0,),
+    burrow_y=(100.0,),
+    start_x=(0.0,),
+    start_y=(0.0,),
+    t_max=60.0,
+    max_workers=None,
+    chunk_size=2000,
+):
+    """
+    在参数网格上扫描追上时间和追上位置，结果缓存在磁盘上的内存映射数组中
+
+    缓存按参数值为键：中断后重新运行、或在网格上增加新的参数值时，只计算缺少的点。
+    待计算的点按 chunk_size 分段交给进程池，每段用 solve_hunting_batch 批量积分，
+    每完成一段就写回缓存。
+
+    参数:
+    cache_path - .npy 缓存文件路径
+    v_rabbit - 兔子速度的取值
+    speed_ratio - 速度比的取值
+    burrow_y - 洞穴距离（兔子起点到洞穴）的取值
+    start_x, start_y - 猎犬起点坐标的取值
+    t_max - 最大模拟时间
+    max_workers - 进程数，None表示使用CPU核数，1表示在当前进程内计算
+    chunk_size - 每段的扫描点数
+
+    返回:
+    字典，包含：
+    axes - 各参数轴的取值，键同 SWEEP_KEYS 的前5个
+    catch_time - 追上时间，形状为各轴长度 (n_v, n_k, n_b, n_x, n_y)，未追上为nan
+    catch_x, catch_y - 追上位置，形状同上
+    escaped - 兔子是否先到达洞穴，形状同上
+    computed - 本次新计算的点数
+    """
+    axes = {
+        "v_rabbit": np.atleast_1d(np.asarray(v_rabbit, dtype=float)),
+        "speed_ratio": np.atleast_1d(np.asarray(speed_ratio, dtype=float)),
+        "burrow_y": np.atleast_1d(np.asarray(burrow_y, dtype=float)),
+        "start_x": np.atleast_1d(np.asarray(start_x, dtype=float)),
+        "start_y": np.atleast_1d(np.asarray(start_y, dtype=float)),
+    }
+    shape = tuple(len(a) for a in axes.values())
+    grid = np.meshgrid(*axes.values(), indexing="ij")
+    keys = np.column_stack([g.ravel() for g in grid] + [np.full(grid[0].size, float(t_max))])
+
+    records, index = _open_sweep_cache(cache_path, keys)
+    todo = np.unique(index[~records["done"][index]])
+
+    def store(rows, result):
+        catch_time, catch_position, escaped = result
+        block = records[rows]
+        block["catch_time"] = catch_time
+        block["catch_x"] = catch_position[:, 0]
+        block["catch_y"] = catch_position[:, 1]
+        block["escaped"] = escaped
+        block["done"] = True
+        records[rows] = block
+        records.flush()
+
+    chunks = [todo[i : i + chunk_size] for i in range(0, len(todo), chunk_size)]
+    params = [np.column_stack([records[name][rows] for name in SWEEP_KEYS]) for rows in chunks]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers == 1 or len(chunks) <= 1:
+        for rows, p in zip(chunks, params):
+            store(rows, _sweep_chunk(p))
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            futures = {pool.submit(_sweep_chunk, p): rows for rows, p in zip(chunks, params)}
+            for future in as_completed(futures):
+                store(futures[future], future.result())
+
+    selected = records[index]
+    del records
+    return {
+        "axes": axes,
+        "catch_time": selected["catch_time"].reshape(shape),
+        "catch_x": selected["catch_x"].reshape(shape),
+        "catch_y": selected["catch_y"].reshape(shape),
+        "escaped": selected["escaped"].reshape(shape),
+        "computed": len(todo),
+    }
+
+
+def plot_trajectories(trajectory, n_points=1000):
+    """
+    绘制猎犬和兔子的运动轨迹
+
+    参数:
+    trajectory - PursuitTrajectory 轨迹对象
+    n_points - 绘图采样点数
+    """
     plt.figure(figsize=(10, 8))
 
-    # 找到追上时刻的索引
-    catch_index = np.argmin(np.abs(t - catch_time))
+    # 轨迹在追上时刻结束，只在这一段上按绘图分辨率取点
+    _, dog_positions, rabbit_positions = trajectory.sample(n_points)
+    catch_position = trajectory.catch_position
 
-    # 只绘制追上之前的轨迹
     # 绘制猎犬轨迹
     plt.plot(
-        dog_positions[: catch_index + 1, 0],
-        dog_positions[: catch_index + 1, 1],
+        dog_positions[:, 0],
+        dog_positions[:, 1],
         color="navy",
         linestyle="-",
         linewidth=2,
@@ -120,8 +1022,8 @@ def plot_trajectories(t, dog_positions, rabbit_positions, catch_time, catch_posi
 
     # 绘制兔子轨迹
     plt.plot(
-        rabbit_positions[: catch_index + 1, 0],
-        rabbit_positions[: catch_index + 1, 1],
+        rabbit_positions[:, 0],
+        rabbit_positions[:, 1],
         "r-",
         linewidth=2,
         label="兔子轨迹",
@@ -133,13 +1035,14 @@ def plot_trajectories(t, dog_positions, rabbit_positions, catch_time, catch_posi
     plt.plot(100, 100, "go", markersize=10, label="兔子洞穴")
 
     # 标记追上位置
-    plt.plot(
-        catch_position[0],
-        catch_position[1],
-        "mo",
-        markersize=10,
-        label=f"追上位置 ({catch_position[0]:.2f}, {catch_position[1]:.2f})",
-    )
+    if catch_position is not None:
+        plt.plot(
+            catch_position[0],
+            catch_position[1],
+            "mo",
+            markersize=10,
+            label=f"追上位置 ({catch_position[0]:.2f}, {catch_position[1]:.2f})",
+        )
 
     # 设置图形属性
     plt.grid(True)
@@ -159,12 +1062,113 @@ def plot_trajectories(t, dog_positions, rabbit_positions, catch_time, catch_posi
     print(f"图像已保存到: {output_path}")
 
 
+def animate_trajectories(
+    trajectories,
+    output_path=None,
+    fps=30,
+    duration=None,
+    playback_speed=1.0,
+    dpi=100,
+):
+    """
+    以动画形式显示一条或多条追击轨迹
+
+    帧数只由目标帧率和时长决定（与求解器步数无关），每帧的位置由轨迹对象按帧时刻计算；
+    所有猎犬轨迹放在一个 LineCollection 中、所有位置标记放在两个散点对象中，
+    每帧只原地更新这些对象，显示时使用 blit 只重绘变化的部分。
+    保存时逐帧交给写入器（ffmpeg 通过管道直接写入视频或GIF），不在内存中保留所有帧。
+
+    参数:
+    trajectories - PursuitTrajectory 或其列表
+    output_path - 输出文件路径（.mp4、.gif 等），None 表示在窗口中显示
+    fps - 目标帧率
+    duration - 动画时长（秒），None 表示按 playback_speed 倍速播放
+    playback_speed - 播放速度倍数（duration 为 None 时有效）
+    dpi - 输出分辨率
+
+    返回:
+    FuncAnimation 对象
+    """
+    if isinstance(trajectories, PursuitTrajectory):
+        trajectories = [trajectories]
+    t_total = max(traj.t_end for traj in trajectories)
+    if duration is None:
+        duration = t_total / playback_speed
+    n_frames = max(2, int(np.ceil(duration * fps)))
+    frame_times = np.linspace(0, t_total, n_frames)
+
+    # 按帧时刻取点：形状 (轨迹数, 帧数, 2)
+    dogs = np.stack([traj.dog_position(frame_times) for traj in trajectories])
+    rabbits = np.stack([traj.rabbit_position(frame_times) for traj in trajectories])
+
+    fig, ax = plt.subplots(figsize=(8, 8))
+    points = np.concatenate([dogs.reshape(-1, 2), rabbits.reshape(-1, 2)])
+    margin = 5
+    ax.set_xlim(points[:, 0].min() - margin, points[:, 0].max() + margin)
+    ax.set_ylim(points[:, 1].min() - margin, points[:, 1].max() + margin)
+    ax.set_aspect("equal")
+    ax.grid(True)
+    ax.set_xlabel("x坐标 (米)")
+    ax.set_ylabel("y坐标 (米)")
+
+    dog_lines = LineCollection([], colors="navy", linewidths=1.5, label="猎犬轨迹")
+    rabbit_lines = LineCollection([], colors="red", linewidths=1.5, label="兔子轨迹")
+    ax.add_collection(dog_lines)
+    ax.add_collection(rabbit_lines)
+    dog_markers = ax.scatter([], [], c="navy", s=30, zorder=3)
+    rabbit_markers = ax.scatter([], [], c="red", s=30, zorder=3)
+    time_text = ax.text(0.02, 0.96, "", transform=ax.transAxes)
+    ax.legend(loc="lower right")
+    artists = (dog_lines, rabbit_lines, dog_markers, rabbit_markers, time_text)
+
+    def init():
+        dog_lines.set_segments([])
+        rabbit_lines.set_segments([])
+        dog_markers.set_offsets(np.zeros((0, 2)))
+        rabbit_markers.set_offsets(np.zeros((0, 2)))
+        time_text.set_text("")
+        return artists
+
+    def update(i):
+        dog_lines.set_segments(dogs[:, : i + 1])
+        rabbit_lines.set_segments(rabbits[:, : i + 1])
+        dog_markers.set_offsets(dogs[:, i])
+        rabbit_markers.set_offsets(rabbits[:, i])
+        time_text.set_text(f"t = {frame_times[i]:.2f} 秒")
+        return artists
+
+    anim = FuncAnimation(
+        fig,
+        update,
+        frames=range(n_frames),
+        init_func=init,
+        interval=1000 / fps,
+        blit=True,
+        cache_frame_data=False,
+    )
+
+    if output_path is None:
+        plt.show()
+        return anim
+
+    if writers.is_available("ffmpeg"):
+        writer = FFMpegWriter(fps=fps)
+    elif output_path.endswith(".gif"):
+        # 没有 ffmpeg 时退回 Pillow（Pillow 会在结束时统一编码GIF）
+        writer = PillowWriter(fps=fps)
+    else:
+        raise RuntimeError("保存视频需要 ffmpeg")
+    anim.save(output_path, writer=writer, dpi=dpi)
+    plt.close(fig)
+    print(f"动画已保存到: {output_path}")
+    return anim
+
+
 if __name__ == "__main__":
     # 第一问：当v=10m/s时的特定情况
     v_rabbit = 10.0  # 兔子速度10m/s
-    t, dog_positions, rabbit_positions, catch_time, catch_position = (
-        solve_hunting_problem(v_rabbit)
-    )
+    trajectory = solve_hunting_problem(v_rabbit)
+    catch_time, catch_position = trajectory.catch_time, trajectory.catch_position
 
     # 输出结果
     print("\n第一问：v = 10 m/s 的特定情况")
@@ -174,28 +1178,102 @@ if __name__ == "__main__":
     print(f"追上兔子的位置: ({catch_position[0]:.4f}, {catch_position[1]:.4f}) 米")
 
     # 绘制轨迹图
-    plot_trajectories(t, dog_positions, rabbit_positions, catch_time, catch_position)
+    plot_trajectories(trajectory)
+
+    # 不同速度比的追击动画（帧数只取决于 fps 和时长）
+    animate_trajectories(
+        [solve_hunting_problem(v_rabbit, speed_ratio=k) for k in (1.5, 2.0, 3.0)],
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "figures", "2.gif"),
+        fps=15,
+        duration=4,
+    )
 
     # 第二问：一般情况下的分析
     print("\n第二问：一般情况下的分析")
     print("对于任意速度v，我们可以通过数学分析得到：")
 
-    # 计算一般情况下的追及时间和位置
+    # 计算一般情况下的追及时间和位置（解析解）
     # 对于任意v，追及时间为t = 2/3 * 100/v
     # 追及位置为(100, 2/3 * 100)
-    general_time = 2 / 3 * (100 / 1)  # 用v=1表示一般情况
-    general_position_x = 100
-    general_position_y = 2 / 3 * 100
+    general_time, (general_position_x, general_position_y) = pursuit_closed_form(1.0)  # 用v=1表示一般情况
 
     print(f"追上兔子的时间: t = (2/3) * (100/v) = 200/(3v) 秒")
     print(f"当v = 10 m/s时，t = {general_time/10:.4f} 秒")
-    print(f"追上兔子的位置: (100, (2/3) * 100) = (100, 66.6667) 米")
+    print(
+        f"追上兔子的位置: (100, (2/3) * 100) = ({general_position_x:g}, {general_position_y:.4f}) 米"
+    )
     print("注意：追上位置与兔子速度v无关")
 
-    # 验证不同v值的情况
+    # 解析解与数值积分（猎犬必须在洞穴前追上，否则只能数值求解）对比
+    numerical_time = solve_hunting_problem(v_rabbit, method="numerical").catch_time
+    print(
+        f"数值积分: 时间 = {numerical_time:.8f} 秒, 解析解: 时间 = {general_time / v_rabbit:.8f} 秒"
+    )
+
+    # 验证不同v值的情况：所有场景一起批量积分
     print("\n验证不同v值的情况：")
-    for v in [5, 10, 15, 20]:
-        t, _, _, catch_time, catch_position = solve_hunting_problem(v)
+    speeds = np.array([5, 10, 15, 20], dtype=float)
+    batch = solve_hunting_batch(speeds)
+    for v, catch_time, catch_position in zip(
+        speeds, batch["catch_time"], batch["catch_position"]
+    ):
         print(
-            f"v = {v} m/s: 时间 = {catch_time:.4f} 秒, 位置 = ({catch_position[0]:.4f}, {catch_position[1]:.4f}) 米"
+            f"v = {v:g} m/s: 时间 = {catch_time:.4f} 秒, 位置 = ({catch_position[0]:.4f}, {catch_position[1]:.4f}) 米"
         )
+
+    # 大规模参数扫描：兔子速度 × 速度比 × 猎犬起点
+    rng = np.random.default_rng(0)
+    n_scenarios = 20000
+    sweep = solve_hunting_batch(
+        rng.uniform(5, 20, n_scenarios),
+        rng.uniform(1.2, 3.0, n_scenarios),
+        np.column_stack([rng.uniform(-50, 50, n_scenarios), rng.uniform(-50, 0, n_scenarios)]),
+        t_max=60.0,
+    )
+    print(
+        f"\n参数扫描 {n_scenarios} 个场景：在洞穴前追上 {int((sweep['caught'] & ~sweep['escaped']).sum())} 个，"
+        f"兔子逃进洞穴 {int(sweep['escaped'].sum())} 个，未追上 {int((~sweep['caught'] & ~sweep['escaped']).sum())} 个"
+    )
+
+    # 前向灵敏度：一次积分得到追上时间对各参数的导数
+    sensitivity = solve_hunting_sensitivity(v_rabbit)
+    print("\n追上时间对参数的导数：")
+    for name, value in zip(sensitivity["params"], sensitivity["d_catch_time"]):
+        print(f"  dT/d{name} = {value:.6f}")
+
+    # 流式求解：边积分边按块取数据，追上时自动结束
+    chunks = 0
+    for t_chunk, hound, rabbit, distance in stream_hunting_problem(v_rabbit, chunk_size=200):
+        chunks += 1
+    print(
+        f"\n流式求解：共 {chunks} 块，最后时刻 t = {t_chunk[-1]:.4f} 秒，"
+        f"此时距离 {distance[-1]:.2e} 米"
+    )
+
+    # 多只猎犬追多只兔子：兔子从 x 轴跑向各自的洞穴，猎犬每步追最近的兔子
+    n_dogs, n_rabbits = 2000, 1000
+    pack = simulate_pack_pursuit(
+        np.column_stack([rng.uniform(0, 1000, n_dogs), rng.uniform(-200, 0, n_dogs)]),
+        20.0,
+        np.column_stack([rng.uniform(0, 1000, n_rabbits), np.zeros(n_rabbits)]),
+        np.column_stack([rng.uniform(0, 1000, n_rabbits), np.full(n_rabbits, 300.0)]),
+        rng.uniform(5, 15, n_rabbits),
+        dt=0.05,
+    )
+    print(
+        f"{n_dogs} 只猎犬追 {n_rabbits} 只兔子：捕获 {int(np.isfinite(pack['capture_time']).sum())} 只，"
+        f"逃进洞穴 {int(pack['escaped'].sum())} 只，用时 {pack['t']:.2f} 秒"
+    )
+
+    # 带磁盘缓存的并行参数扫描：再次运行时只计算缓存中没有的点
+    surface = sweep_pursuit(
+        os.path.join(tempfile.gettempdir(), "pursuit_sweep.npy"),
+        v_rabbit=np.linspace(5, 20, 16),
+        speed_ratio=np.linspace(1.2, 3.0, 19),
+        burrow_y=[100.0, 150.0],
+    )
+    print(
+        f"参数扫描（缓存）：本次计算 {surface['computed']} 个点，"
+        f"v = 10, k = 2, 洞穴距离 100 时追上时间 = "
+        f"{np.interp(10, surface['axes']['v_rabbit'], surface['catch_time'][:, 8, 0, 0, 0]):.4f} 秒"
+    )
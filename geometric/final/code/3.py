@@ -5,25 +5,382 @@
 向量组极大线性无关组计算
 """
 
+from fractions import Fraction
+from math import isqrt, lcm
+
 import numpy as np
-from sympy import Matrix
+from scipy.linalg import qr, solve_triangular
+from sympy import Matrix, prevprime
+
+# 多模引擎使用的素数：小于 2^31，两数相乘不超过 2^62，可以直接用 int64 运算
+_PRIMES = []
+
+
+def _modular_prime(i):
+    """返回第 i 个小于 2^31 的素数（从大到小）"""
+    while len(_PRIMES) <= i:
+        _PRIMES.append(prevprime(_PRIMES[-1] if _PRIMES else 2**31))
+    return _PRIMES[i]
+
+
+def _max_independent_qr(vectors_array, tol=None):
+    """
+    用列主元QR分解求极大线性无关组（浮点数引擎）
+
+    把向量作为列排成矩阵 A (d x n)，列主元QR分解 A P = Q R 中
+    |R[i, i]| 大于容差的前 r 个主元列就是一个极大线性无关组；
+    其余列的表示系数 X 满足 R11 X = R12，一次上三角回代即可求出
+
+    参数:
+    vectors_array - 向量组，每行是一个向量，形状 (n, d)
+    tol - 秩判定的相对容差（相对于 |R[0, 0]|），None 表示 max(n, d) * 机器精度
+
+    返回:
+    independent_indices - 极大无关组的下标（升序）
+    dependent_indices - 其余向量的下标（升序）
+    coefficients - 系数矩阵，形状 (len(independent_indices), len(dependent_indices))
+    """
+    n, d = vectors_array.shape
+    if n == 0:
+        return [], [], np.zeros((0, 0))
+    A = vectors_array.T
+    _, R, perm = qr(A, mode="economic", pivoting=True)
+    diag = np.abs(np.diag(R))
+    if tol is None:
+        tol = max(n, d) * np.finfo(float).eps
+    rank = int(np.sum(diag > tol * diag[0])) if diag.size and diag[0] > 0 else 0
+
+    coefficients = solve_triangular(R[:rank, :rank], R[:rank, rank:])
+    # 主元和非主元都按原下标排序，系数矩阵的行、列随之重排
+    ind_order = np.argsort(perm[:rank])
+    dep_order = np.argsort(perm[rank:])
+    independent_indices = perm[:rank][ind_order].tolist()
+    dependent_indices = perm[rank:][dep_order].tolist()
+    return independent_indices, dependent_indices, coefficients[ind_order][:, dep_order]
+
+
+def _rref_mod_p(A, p):
+    """
+    模 p 的行简化阶梯形（向量化的 int64 高斯-若尔当消元）
+
+    参数:
+    A - 元素在 [0, p) 内的 int64 矩阵，形状 (d, n)
+    p - 素数，小于 2^31
+
+    返回:
+    rref - 行简化阶梯形的非零行，形状 (r, n)
+    pivots - 主元列的下标
+    """
+    M = A.copy()
+    d, n = M.shape
+    pivots = []
+    row = 0
+    for col in range(n):
+        if row == d:
+            break
+        nonzero = np.flatnonzero(M[row:, col])
+        if nonzero.size == 0:
+            continue
+        k = row + nonzero[0]
+        if k != row:
+            M[[row, k]] = M[[k, row]]
+        M[row, col:] = M[row, col:] * pow(int(M[row, col]), -1, p) % p
+        factors = M[:, col].copy()
+        factors[row] = 0
+        M[:, col:] = (M[:, col:] - np.outer(factors, M[row, col:]) % p) % p
+        pivots.append(col)
+        row += 1
+    return M[:row], pivots
+
+
+def _rational_reconstruct(u, m):
+    """
+    有理重构：求 a/b ≡ u (mod m)，|a|、b 不超过 sqrt(m/2)；不存在时返回None
+    """
+    bound = isqrt(m // 2)
+    r0, r1 = m, u % m
+    s0, s1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    if s1 == 0 or abs(s1) > bound:
+        return None
+    return Fraction(r1, s1)
+
+
+def _reconstruct_all(values, modulus):
+    """
+    对一组余数做有理重构，无法重构时返回None
+
+    系数通常有公共分母：先用已经得到的分母的最小公倍数 L 试探，
+    u*L mod m 的对称余数足够小时直接得到分子，只有试探失败时才做完整的扩展欧几里得
+    """
+    half = modulus // 2
+    bound = isqrt(half)
+    common = 1
+    fractions = []
+    for u in values:
+        numerator = int(u) * common % modulus
+        if numerator > half:
+            numerator -= modulus
+        if abs(numerator) <= bound:
+            fractions.append(Fraction(numerator, common))
+            continue
+        f = _rational_reconstruct(int(u), modulus)
+        if f is None:
+            return None
+        common = lcm(common, f.denominator)
+        fractions.append(f)
+    return fractions
+
+
+def _max_independent_modular(vectors, max_primes=64):
+    """
+    多模方法求整数向量组的极大线性无关组和精确的有理系数
+
+    在若干个字长素数下分别做 int64 向量化消元，取主元位置一致（秩最大、位置最靠前）的素数，
+    用中国剩余定理合并各素数下的系数，再用有理重构还原成分数；
+    重构结果在一个新的素数下仍然成立时结束，否则继续增加素数
+
+    参数:
+    vectors - 整数向量组，每行是一个向量
+    max_primes - 最多使用的素数个数
+
+    返回:
+    independent_indices - 极大无关组的下标（与 rref 相同，取最靠前的主元列）
+    dependent_indices - 其余向量的下标
+    coefficients - 系数矩阵（Fraction），形状 (len(independent_indices), len(dependent_indices))
+    """
+
+    def to_int(x):
+        if isinstance(x, (int, np.integer)) or float(x).is_integer():
+            return int(x)
+        raise ValueError("多模引擎只适用于整数向量组")
+
+    A = np.array([[to_int(x) for x in v] for v in vectors], dtype=object).T
+    n = len(vectors)
+    if not any(x != 0 for x in A.ravel()):
+        return [], list(range(n)), np.zeros((0, n), dtype=object)
+
+    best = None
+    for i in range(max_primes):
+        p = _modular_prime(i)
+        rref, pivots = _rref_mod_p((A % p).astype(np.int64), p)
+        # 坏素数只会使秩变小或主元后移，所以取秩最大、主元最靠前的结果
+        key = (len(pivots), [-c for c in pivots])
+        if best is None or key > best:
+            best = key
+            independent = pivots
+            pivot_set = set(pivots)
+            dependent = [j for j in range(n) if j not in pivot_set]
+            combined, modulus, reconstructed = None, 1, None
+        elif key < best:
+            continue
+        if not dependent:
+            return independent, dependent, np.zeros((len(independent), 0), dtype=object)
+        if not independent:
+            # 所有元素都被 p 整除，换下一个素数
+            continue
+        values = rref[:, dependent]
+
+        # 上一次重构出的分数在新素数下仍然成立，认为结果已稳定
+        if reconstructed is not None:
+            check = np.array(
+                [f.numerator * pow(f.denominator, -1, p) % p for f in reconstructed.ravel()],
+                dtype=np.int64,
+            ).reshape(values.shape)
+            if np.array_equal(check, values):
+                return independent, dependent, reconstructed
+
+        # 中国剩余定理：把模 p 的余数并入模 modulus 的结果
+        if combined is None:
+            combined = values.astype(object)
+        else:
+            inverse = pow(modulus % p, -1, p)
+            lift = (values - (combined % p).astype(np.int64)) % p * inverse % p
+            combined = combined + modulus * lift.astype(object)
+        modulus *= p
+
+        # 模数还不够大时有的元素无法重构，继续增加素数；先试探首尾两个元素，避免每次都完整重构
+        flat = combined.ravel()
+        if any(_rational_reconstruct(int(u), modulus) is None for u in (flat[0], flat[-1])):
+            reconstructed = None
+            continue
+        fractions = _reconstruct_all(flat, modulus)
+        reconstructed = (
+            None if fractions is None else np.array(fractions, dtype=object).reshape(combined.shape)
+        )
+    raise RuntimeError("多模引擎未能在给定素数个数内得到稳定的有理系数")
+
 
+class IncrementalBasis:
+    """
+    逐个接收向量、随时维护极大线性无关组的增量基
+
+    内部保存已选基向量 B（按列）的 QR 分解 B = Q R，新向量到来时用带再正交化的
+    Gram-Schmidt（两遍正交化）求出它在 Q 上的投影和剩余部分：
+    剩余部分足够大时向量线性无关，把单位化的剩余部分追加到 Q；
+    否则向量可由已有的基表示，系数由 R c = Q^T v 回代得到。
+    每次插入的计算量为 O(d·r)（d 为维数，r 为当前秩）；
+    Q 和基向量存放在容量按倍增长的缓冲区中，内存为 O(d·r) 而不是 O(d²)
+
+    属性:
+    dim - 向量维数
+    tol - 相对容差：剩余部分的范数不超过 tol * |v| 时视为线性相关
+    indices - 基向量在输入序列中的编号
+    rank - 当前的秩
+    """
+
+    def __init__(self, dim, tol=1e-10):
+        self.dim = dim
+        self.tol = tol
+        self.indices = []
+        self._count = 0
+        # 正交基按行存放，前 rank 行连续，矩阵-向量乘法更快；容量不够时倍增
+        capacity = min(dim, 8)
+        self._Q = np.zeros((capacity, dim))
+        self._R = np.zeros((capacity, capacity))
+        self._basis = np.zeros((capacity, dim))
+
+    @property
+    def rank(self):
+        return len(self.indices)
+
+    @property
+    def basis(self):
+        """当前的基向量，每行一个"""
+        return self._basis[: self.rank].copy()
+
+    def _grow(self):
+        """缓冲区容量翻倍（不超过 dim），保留已有的前 rank 行"""
+        r = self.rank
+        capacity = min(self.dim, 2 * max(r, 1))
+        Q = np.zeros((capacity, self.dim))
+        R = np.zeros((capacity, capacity))
+        basis = np.zeros((capacity, self.dim))
+        Q[:r], R[:r, :r], basis[:r] = self._Q[:r], self._R[:r, :r], self._basis[:r]
+        self._Q, self._R, self._basis = Q, R, basis
+
+    def _project(self, v):
+        """两遍 Gram-Schmidt：返回投影系数 h 和与当前基正交的剩余部分 w"""
+        Q = self._Q[: self.rank]
+        h = Q @ v
+        w = v - h @ Q
+        correction = Q @ w
+        w -= correction @ Q
+        return h + correction, w
+
+    def represent(self, vector):
+        """
+        用当前的基表示一个向量（不插入）
+
+        参数:
+        vector - 长度为 dim 的向量
+
+        返回:
+        coefficients - 在当前基上的系数，长度为 rank
+        residual - 无法由当前基表示的部分的范数
+        """
+        v = np.asarray(vector, dtype=float)
+        h, w = self._project(v)
+        r = self.rank
+        coefficients = solve_triangular(self._R[:r, :r], h, check_finite=False) if r else np.zeros(0)
+        return coefficients, float(np.linalg.norm(w))
 
-def calculate_max_independent_vectors(vectors):
+    def add(self, vector):
+        """
+        插入一个向量
+
+        参数:
+        vector - 长度为 dim 的向量
+
+        返回:
+        independent - 是否与已有的基线性无关（无关时加入基）
+        coefficients - 线性相关时在当前基上的系数（长度为 rank），无关时为None
+        """
+        v = np.asarray(vector, dtype=float)
+        index = self._count
+        self._count += 1
+        h, w = self._project(v)
+        r = self.rank
+        norm_w = np.linalg.norm(w)
+        if r < self.dim and norm_w > self.tol * np.linalg.norm(v):
+            if r == len(self._Q):
+                self._grow()
+            self._Q[r] = w / norm_w
+            self._R[:r, r] = h
+            self._R[r, r] = norm_w
+            self._basis[r] = v
+            self.indices.append(index)
+            return True, None
+        coefficients = solve_triangular(self._R[:r, :r], h[:r], check_finite=False) if r else np.zeros(0)
+        return False, coefficients
+
+
+def calculate_max_independent_vectors(vectors, method="rref", tol=None):
     """
     计算向量组的极大线性无关组，并将其余向量用极大无关组线性表示
 
     参数:
     vectors - 向量组，每行是一个向量
+    method - "rref"（sympy 精确行简化，适合小规模）、"qr"（列主元QR分解，适合成千上万个高维向量）
+             、"modular"（整数向量组的多模精确算法，系数为 Fraction）
+             或 "incremental"（用 IncrementalBasis 逐个插入，结果与 rref 的主元相同）
+    tol - "qr"、"incremental" 引擎的相对容差，None 表示使用各自的默认值
 
     返回:
     independent_vectors - 极大线性无关组
     dependent_vectors - 依赖向量
     coefficients - 依赖向量表示为极大无关组线性组合的系数
+    independent_indices - 极大无关组的下标
+    dependent_indices - 依赖向量的下标
     """
     # 转换为numpy数组
     vectors_array = np.array(vectors, dtype=float)
 
+    if method == "qr":
+        independent_indices, dependent_indices, coef_matrix = _max_independent_qr(
+            vectors_array, tol
+        )
+        return (
+            vectors_array[independent_indices],
+            vectors_array[dependent_indices] if dependent_indices else [],
+            coef_matrix.T.tolist(),
+            independent_indices,
+            dependent_indices,
+        )
+    if method == "modular":
+        independent_indices, dependent_indices, coef_matrix = _max_independent_modular(vectors)
+        return (
+            vectors_array[independent_indices],
+            vectors_array[dependent_indices] if dependent_indices else [],
+            coef_matrix.T.tolist(),
+            independent_indices,
+            dependent_indices,
+        )
+    if method == "incremental":
+        basis = IncrementalBasis(vectors_array.shape[1], 1e-10 if tol is None else tol)
+        dependent_indices, dependent_coefficients = [], []
+        for i, v in enumerate(vectors_array):
+            independent, coef = basis.add(v)
+            if not independent:
+                dependent_indices.append(i)
+                dependent_coefficients.append(coef)
+        # 插入时的系数只涉及当时已有的基向量，后加入的基向量系数补0
+        coefficients = [
+            np.pad(coef, (0, basis.rank - len(coef))).tolist() for coef in dependent_coefficients
+        ]
+        return (
+            vectors_array[basis.indices],
+            vectors_array[dependent_indices] if dependent_indices else [],
+            coefficients,
+            list(basis.indices),
+            dependent_indices,
+        )
+    if method != "rref":
+        raise ValueError(f"未知的计算方法: {method}")
+
     # 使用sympy的Matrix进行行简化
     A = Matrix(vectors_array.T)  # 转置，使每个向量成为矩阵的一列
     rref, pivots = A.rref()  # 行简化阶梯形
@@ -74,6 +431,73 @@ def calculate_max_independent_vectors(vectors):
     )
 
 
+def calculate_max_independent_vectors_batch(groups, tol=1e-10):
+    """
+    批量计算许多个向量组的极大线性无关组
+
+    所有向量组叠成形状 (组数, n, d) 的数组，对每组的 A = V^T (d x n) 同时做
+    部分主元的高斯-若尔当消元：循环只发生在 n 个列上，每一步对所有组做向量运算，
+    没有逐组的 Python 循环。主元列与 rref 相同（取最靠前的无关向量）
+
+    参数:
+    groups - 向量组，形状 (组数, n, d)，每组 n 个 d 维向量
+    tol - 相对容差：主元绝对值不超过 tol * max(n, d) * 该组最大元素 时视为0
+
+    返回:
+    字典，包含：
+    pivots - 每个向量是否属于极大无关组，形状 (组数, n)
+    rank - 每组的秩，形状 (组数,)
+    coefficients - 系数矩阵 C，形状 (组数, n, n)：第 j 个向量 = sum_i C[j, i] * 第 i 个向量，
+                   其中 i 只取极大无关组中的向量；无关向量的行是单位向量
+    errors - 用系数重构各向量的误差范数，形状 (组数, n)
+    """
+    V = np.asarray(groups, dtype=float)
+    n_groups, n, d = V.shape
+    A = np.swapaxes(V, 1, 2).copy()
+    g = np.arange(n_groups)
+    scale = np.abs(V).reshape(n_groups, -1).max(axis=1, initial=0.0)
+    threshold = tol * max(n, d) * np.maximum(scale, np.finfo(float).tiny)
+
+    row = np.zeros(n_groups, dtype=int)
+    pivots = np.zeros((n_groups, n), dtype=bool)
+    rows = np.arange(d)
+    for col in range(n):
+        # 在尚未使用的行中选绝对值最大的元素作为主元
+        candidate = np.where(rows[None, :] >= row[:, None], np.abs(A[:, :, col]), -1.0)
+        k = np.argmax(candidate, axis=1)
+        has_pivot = (candidate[g, k] > threshold) & (row < d)
+        active = g[has_pivot]
+        if active.size == 0:
+            continue
+        r, k = row[active], k[active]
+
+        # 交换行、单位化主元行、消去其余各行在该列的元素
+        pivot_row = A[active, k].copy()
+        A[active, k] = A[active, r]
+        pivot_row /= pivot_row[:, col : col + 1]
+        A[active, r] = pivot_row
+        factors = A[active, :, col].copy()
+        factors[np.arange(active.size), r] = 0
+        A[active] -= factors[:, :, None] * pivot_row[:, None, :]
+
+        pivots[active, col] = True
+        row[active] += 1
+
+    # 第 i 个主元列对应第 pos[i] 行，非主元列 j 在该行的元素就是系数
+    pos = np.clip(np.cumsum(pivots, axis=1) - 1, 0, max(d - 1, 0))
+    G = np.take_along_axis(A, pos[:, :, None], axis=1) if d else np.zeros((n_groups, n, n))
+    coefficients = np.swapaxes(G, 1, 2) * pivots[:, None, :] * ~pivots[:, :, None]
+    coefficients += np.eye(n) * pivots[:, :, None]
+
+    errors = np.linalg.norm(coefficients @ V - V, axis=2)
+    return {
+        "pivots": pivots,
+        "rank": pivots.sum(axis=1),
+        "coefficients": coefficients,
+        "errors": errors,
+    }
+
+
 def print_results(
     vectors,
     independent_vectors,
@@ -97,14 +521,17 @@ def print_results(
     for i, idx in enumerate(dependent_indices):
         coef = coefficients[i]
         expression = " + ".join(
-            [f"{coef[j]:.1f} * α_{independent_indices[j]+1}" for j in range(len(coef))]
+            [
+                f"{coef[j] if isinstance(coef[j], Fraction) else format(coef[j], '.4g')} * α_{independent_indices[j]+1}"
+                for j in range(len(coef))
+            ]
         )
         print(f"α_{idx+1} = {expression}")
 
         # 验证结果
         calculated = np.sum(
             [
-                coef[j] * np.array(vectors[independent_indices[j]], dtype=float)
+                float(coef[j]) * np.array(vectors[independent_indices[j]], dtype=float)
                 for j in range(len(coef))
             ],
             axis=0,
@@ -147,3 +574,56 @@ if __name__ == "__main__":
         independent_indices,
         dependent_indices,
     )
+
+    # 浮点数引擎：列主元QR分解，主元列按范数选取，可能与行简化得到的无关组不同
+    print("=" * 50)
+    print("列主元QR分解（浮点数引擎）:")
+    print_results(vectors, *calculate_max_independent_vectors(vectors, method="qr"))
+
+    # 多模精确引擎：与行简化的主元相同，系数为精确分数
+    print("=" * 50)
+    print("多模精确算法（整数向量组）:")
+    print_results(vectors, *calculate_max_independent_vectors(vectors, method="modular"))
+
+    # 增量基：向量逐个到来时立即判断是否线性无关
+    print("=" * 50)
+    print("增量基（逐个插入）:")
+    stream = IncrementalBasis(len(vectors[0]))
+    for i, v in enumerate(vectors):
+        independent, coef = stream.add(v)
+        if independent:
+            print(f"α_{i+1} 线性无关，加入基，当前秩 {stream.rank}")
+        else:
+            expression = " + ".join(
+                f"{c:.4g} * α_{idx+1}" for c, idx in zip(coef, stream.indices)
+            )
+            print(f"α_{i+1} = {expression}")
+
+    # 高维、低秩的数据流：内存只随 秩×维数 增长，缓冲区容量按需倍增
+    rng = np.random.default_rng(0)
+    dim, true_rank = 200000, 10
+    generators = rng.standard_normal((true_rank, dim))
+    stream = IncrementalBasis(dim)
+    worst = 0.0
+    for k in range(3 * true_rank):
+        weights = rng.standard_normal(true_rank) if k >= true_rank else np.eye(true_rank)[k]
+        v = weights @ generators
+        independent, coef = stream.add(v)
+        if not independent:
+            worst = max(worst, np.linalg.norm(coef @ stream.basis - v) / np.linalg.norm(v))
+    assert stream.rank == true_rank and stream._Q.shape[0] < dim
+    print(
+        f"维数 {dim} 的数据流：秩 {stream.rank}，缓冲区 {stream._Q.shape[0]} 行，"
+        f"相关向量的最大相对重构误差 {worst:.2e}"
+    )
+
+    # 批量计算：把许多个同样大小的向量组叠在一起一次完成
+    print("=" * 50)
+    print("批量计算（组数, n, d）:")
+    rng = np.random.default_rng(0)
+    many = rng.integers(-3, 4, size=(100000, 5, 4)).astype(float)
+    many[0] = vectors
+    batch = calculate_max_independent_vectors_batch(many)
+    print(f"共 {len(many)} 组，秩分布: {np.bincount(batch['rank'])}")
+    print(f"第1组（题目中的向量组）主元: {np.flatnonzero(batch['pivots'][0]).tolist()}")
+    print(f"最大重构误差: {batch['errors'].max():.2e}")
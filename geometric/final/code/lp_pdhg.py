@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+一阶原始-对偶混合梯度法（PDHG，参考 PDLP）求解大规模稀疏线性规划
+
+处理的模型形式与 solve_lp_matrix 相同：
+    min/max c^T x
+    s.t.    A_ub x <= b_ub
+            lb <= x <= ub
+
+每次迭代只需要一次 A x 和一次 A^T y 的稀疏矩阵-向量乘法，
+内存只与非零元个数成正比，适合单纯形法内存或时间不够的超大模型。
+为了加快收敛，实现中包括：
+1. 对角预处理：Ruiz 均衡化 + Pock-Chambolle 缩放
+2. 重启：平均迭代点或当前迭代点的 KKT 误差充分下降时，从较好的点重新开始
+3. 原始权重：每次重启时根据原始、对偶变量的移动距离调整两者步长的比例
+"""
+
+import numpy as np
+from scipy import sparse
+
+from lp_presolve import normalize_bounds
+
+
+def _ruiz_scaling(A, iterations=10):
+    """
+    Ruiz 均衡化 + Pock-Chambolle 缩放，返回行、列缩放因子
+
+    参数:
+    A - 约束矩阵（csr格式）
+    iterations - Ruiz 迭代次数
+
+    返回:
+    row_scale, col_scale - 使 diag(row_scale) A diag(col_scale) 各行各列范数接近的缩放因子
+    """
+    m, n = A.shape
+    row_scale = np.ones(m)
+    col_scale = np.ones(n)
+    S = A.copy()
+    for _ in range(iterations):
+        row_norm = np.sqrt(abs(S).max(axis=1).toarray().ravel())
+        col_norm = np.sqrt(abs(S).max(axis=0).toarray().ravel())
+        row_norm[row_norm == 0] = 1.0
+        col_norm[col_norm == 0] = 1.0
+        S = sparse.diags_array(1 / row_norm) @ S @ sparse.diags_array(1 / col_norm)
+        row_scale /= row_norm
+        col_scale /= col_norm
+
+    # Pock-Chambolle (alpha = 1)：按行、列的1-范数再缩放一次
+    row_norm = np.sqrt(abs(S).sum(axis=1))
+    col_norm = np.sqrt(abs(S).sum(axis=0))
+    row_norm[row_norm == 0] = 1.0
+    col_norm[col_norm == 0] = 1.0
+    return row_scale / row_norm, col_scale / col_norm
+
+
+def _estimate_norm(A, iterations=30, seed=0):
+    """幂迭代估计矩阵的2-范数"""
+    x = np.random.default_rng(seed).standard_normal(A.shape[1])
+    norm = 1.0
+    for _ in range(iterations):
+        x = A.T @ (A @ x)
+        norm = np.linalg.norm(x)
+        if norm == 0:
+            return 1.0
+        x /= norm
+    return np.sqrt(norm)
+
+
+def _kkt_error(A, AT, c, b, lb, ub, x, y):
+    """
+    计算 min c^T x, A x <= b, lb <= x <= ub 的相对 KKT 误差
+
+    返回:
+    primal_res - 相对原始不可行度
+    dual_res - 相对对偶不可行度
+    gap - 相对对偶间隙
+    primal_obj - 原始目标值
+    """
+    primal_res = np.linalg.norm(np.maximum(A @ x - b, 0)) / (1 + np.linalg.norm(b))
+
+    # 约简成本中能由有限边界的乘子吸收的部分计入对偶目标，其余部分是对偶不可行度
+    reduced = c + AT @ y
+    to_lower = (reduced > 0) & np.isfinite(lb)
+    to_upper = (reduced < 0) & np.isfinite(ub)
+    residual = np.where(to_lower | to_upper, 0.0, reduced)
+    dual_res = np.linalg.norm(residual) / (1 + np.linalg.norm(c))
+
+    primal_obj = c @ x
+    dual_obj = (
+        -b @ y + reduced[to_lower] @ lb[to_lower] + reduced[to_upper] @ ub[to_upper]
+    )
+    gap = abs(primal_obj - dual_obj) / (1 + abs(primal_obj) + abs(dual_obj))
+    return primal_res, dual_res, gap, primal_obj
+
+
+def solve_lp_pdhg(
+    c,
+    A_ub,
+    b_ub,
+    bounds=None,
+    maximize=True,
+    tol=1e-6,
+    max_iter=100000,
+    check_every=64,
+):
+    """
+    用带重启和对角预处理的 PDHG 求解线性规划
+
+    参数:
+    c, A_ub, b_ub, bounds, maximize - 含义同 solve_lp_matrix
+    tol - 相对原始不可行度、对偶不可行度和对偶间隙的收敛容差
+    max_iter - 最大迭代次数
+    check_every - 每隔多少次迭代检查收敛和重启条件
+
+    返回:
+    字典，包含：
+    x - 近似最优解
+    objective - 近似最优目标值
+    status - "Optimal"（达到容差）或 "Not Solved"（达到最大迭代次数）
+    y - 约束的对偶变量（影子价格，非负）
+    iterations - 迭代次数
+    primal_residual, dual_residual, gap - 结束时的相对 KKT 误差
+    """
+    sign = -1.0 if maximize else 1.0
+    c = sign * np.asarray(c, dtype=float)
+    A = sparse.csr_array(A_ub, dtype=float)
+    b = np.asarray(b_ub, dtype=float)
+    lb, ub = normalize_bounds(bounds, len(c))
+
+    # 对角预处理：x = D_c x_s，约束行乘以 D_r
+    row_scale, col_scale = _ruiz_scaling(A)
+    As = (sparse.diags_array(row_scale) @ A @ sparse.diags_array(col_scale)).tocsr()
+    AsT = As.T.tocsr()
+    cs = c * col_scale
+    bs = b * row_scale
+    lbs = lb / col_scale
+    ubs = ub / col_scale
+    AT = A.T.tocsr()
+
+    step = 0.9 / _estimate_norm(As)
+    c_norm, b_norm = np.linalg.norm(cs), np.linalg.norm(bs)
+    omega = c_norm / b_norm if c_norm > 0 and b_norm > 0 else 1.0
+
+    x = np.clip(np.zeros(len(c)), lbs, ubs)
+    y = np.zeros(len(b))
+    x_sum, y_sum, weight = np.zeros_like(x), np.zeros_like(y), 0
+    x_restart, y_restart = x.copy(), y.copy()
+    restart_error = np.inf
+    restart_iter = 0
+    status = "Not Solved"
+    Ax = As @ x
+
+    def unscaled_error(xs, ys):
+        return _kkt_error(A, AT, c, b, lb, ub, xs * col_scale, ys * row_scale)
+
+    iteration = 0
+    while iteration < max_iter:
+        tau, sigma = step / omega, step * omega
+        x_new = np.clip(x - tau * (cs + AsT @ y), lbs, ubs)
+        Ax_new = As @ x_new
+        y = np.maximum(y + sigma * (2 * Ax_new - Ax - bs), 0)
+        x, Ax = x_new, Ax_new
+        x_sum += x
+        y_sum += y
+        weight += 1
+        iteration += 1
+
+        if iteration % check_every:
+            continue
+
+        # 当前点和平均点中取 KKT 误差较小者作为候选
+        current = unscaled_error(x, y)
+        average = unscaled_error(x_sum / weight, y_sum / weight)
+        current_error = np.linalg.norm(current[:3])
+        average_error = np.linalg.norm(average[:3])
+        if average_error < current_error:
+            candidate_x, candidate_y = x_sum / weight, y_sum / weight
+            candidate, candidate_error = average, average_error
+        else:
+            candidate_x, candidate_y = x, y
+            candidate, candidate_error = current, current_error
+
+        if max(candidate[:3]) <= tol:
+            x, y = candidate_x, candidate_y
+            status = "Optimal"
+            break
+
+        # 误差充分下降，或距上次重启过久时重启
+        if (
+            candidate_error <= 0.2 * restart_error
+            or iteration - restart_iter >= 0.36 * iteration
+        ):
+            dx = np.linalg.norm(candidate_x - x_restart)
+            dy = np.linalg.norm(candidate_y - y_restart)
+            if dx > 0 and dy > 0:
+                omega = np.exp(0.5 * np.log(dy / dx) + 0.5 * np.log(omega))
+            x, y = candidate_x.copy(), candidate_y.copy()
+            Ax = As @ x
+            x_restart, y_restart = x.copy(), y.copy()
+            x_sum, y_sum, weight = np.zeros_like(x), np.zeros_like(y), 0
+            restart_error = candidate_error
+            restart_iter = iteration
+
+    x_orig = x * col_scale
+    y_orig = y * row_scale
+    primal_res, dual_res, gap, primal_obj = _kkt_error(A, AT, c, b, lb, ub, x_orig, y_orig)
+
+    return {
+        "x": x_orig,
+        "objective": sign * primal_obj,
+        "status": status,
+        "y": y_orig,
+        "iterations": iteration,
+        "primal_residual": primal_res,
+        "dual_residual": dual_res,
+        "gap": gap,
+    }
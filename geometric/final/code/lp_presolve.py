@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+线性规划预处理（presolve）与解的还原（postsolve）
+
+处理的模型形式为：
+    min/max c^T x
+    s.t.    A_ub x <= b_ub
+            lb <= x <= ub
+
+预处理依次反复执行以下化简，直到模型不再变化：
+1. 空行：删除（若右端项为负则模型不可行）
+2. 单变量行：如 x2 <= 7，转为变量的上下界后删除
+3. 冗余行：在变量上下界内左端最大值也不超过右端项，删除
+4. 被支配列：目标系数与约束系数的符号说明该变量取某个边界值最好，直接固定
+5. 固定列：上下界相等的变量代入右端项和目标常数后删除
+"""
+
+import numpy as np
+from scipy import sparse
+
+
+def normalize_bounds(bounds, n):
+    """
+    将变量边界统一转换为上下界数组
+
+    参数:
+    bounds - None（默认 x >= 0）、单个 (lb, ub)，或长度为n的 [(lb, ub), ...]；None表示无界
+    n - 变量个数
+
+    返回:
+    lb - 下界数组（无界为 -inf）
+    ub - 上界数组（无界为 inf）
+    """
+    if bounds is None:
+        bounds = (0, None)
+    if len(bounds) == 2 and not isinstance(bounds[0], (tuple, list)):
+        bounds = [bounds] * n
+    lb = np.array([-np.inf if b[0] is None else b[0] for b in bounds], dtype=float)
+    ub = np.array([np.inf if b[1] is None else b[1] for b in bounds], dtype=float)
+    return lb, ub
+
+
+def _to_bounds_list(lb, ub):
+    """将上下界数组转换回 [(lb, ub), ...] 形式，无界用None表示"""
+    return [
+        (None if np.isinf(low) else float(low), None if np.isinf(high) else float(high))
+        for low, high in zip(lb, ub)
+    ]
+
+
+def presolve_lp(c, A_ub, b_ub, bounds=None, maximize=True, tol=1e-9, integrality=None):
+    """
+    对不等式形式的线性规划做预处理，缩小模型规模
+
+    参数:
+    c - 目标函数系数，长度为n
+    A_ub - 不等式约束矩阵 (m x n)，numpy数组或scipy.sparse矩阵
+    b_ub - 不等式约束右端项，长度为m
+    bounds - 变量边界，格式见 normalize_bounds，默认 x >= 0
+    maximize - 是否为最大化问题，默认True
+    tol - 数值容差
+    integrality - 整数标记，长度为n，1表示整数变量；整数变量的上下界会取整
+                  （下界向上取整、上界向下取整），再用于被支配列、固定列的化简
+
+    返回:
+    字典，包含：
+    status - "Reduced"（已化简）、"Infeasible"（预处理发现不可行）
+    c, A_ub, b_ub, bounds - 化简后的模型，可直接交给求解器
+    offset - 被固定变量贡献的目标函数常数
+    row_index - 保留的约束在原模型中的下标
+    col_index - 保留的变量在原模型中的下标
+    fixed_values - 长度为n的数组，被删除变量的取值（保留变量处为nan）
+    report - 各类化简删除的行数、列数统计
+    """
+    c = np.asarray(c, dtype=float)
+    A = sparse.csr_array(A_ub, dtype=float)
+    b = np.asarray(b_ub, dtype=float).copy()
+    m, n = A.shape
+    lb, ub = normalize_bounds(bounds, n)
+    # 统一按最小化判断被支配列
+    cost = -c if maximize else c
+    integer = (
+        np.zeros(n, dtype=bool) if integrality is None else np.asarray(integrality) != 0
+    )
+
+    def round_integer_bounds():
+        lb[integer] = np.ceil(lb[integer] - tol)
+        ub[integer] = np.floor(ub[integer] + tol)
+
+    round_integer_bounds()
+
+    rows = np.ones(m, dtype=bool)
+    cols = np.ones(n, dtype=bool)
+    fixed_values = np.full(n, np.nan)
+    offset = 0.0
+    report = {
+        "empty_rows": 0,
+        "singleton_rows": 0,
+        "redundant_rows": 0,
+        "fixed_cols": 0,
+        "dominated_cols": 0,
+    }
+    # 整数变量取整后上下界可能交错
+    status = "Infeasible" if (lb > ub + tol).any() else "Reduced"
+
+    changed = True
+    while changed and status == "Reduced":
+        changed = False
+        row_index = np.flatnonzero(rows)
+        col_index = np.flatnonzero(cols)
+        S = A[row_index][:, col_index].tocsr()
+        S.eliminate_zeros()
+        row_nnz = np.diff(S.indptr)
+
+        # 1. 空行
+        empty = row_nnz == 0
+        if empty.any():
+            if (b[row_index[empty]] < -tol).any():
+                status = "Infeasible"
+                break
+            rows[row_index[empty]] = False
+            report["empty_rows"] += int(empty.sum())
+            changed = True
+
+        # 2. 单变量行转为变量边界
+        single = np.flatnonzero(row_nnz == 1)
+        if single.size:
+            j = col_index[S.indices[S.indptr[single]]]
+            a = S.data[S.indptr[single]]
+            limit = b[row_index[single]] / a
+            np.minimum.at(ub, j[a > 0], limit[a > 0])
+            np.maximum.at(lb, j[a < 0], limit[a < 0])
+            round_integer_bounds()
+            rows[row_index[single]] = False
+            report["singleton_rows"] += int(single.size)
+            changed = True
+            if (lb[cols] > ub[cols] + tol).any():
+                status = "Infeasible"
+                break
+
+        # 3. 冗余行：左端最大值不超过右端项
+        keep = ~empty
+        keep[single] = False
+        if keep.any():
+            S_keep = S[np.flatnonzero(keep)]
+            positive = S_keep.maximum(0)
+            negative = S_keep.minimum(0)
+            lb_sub, ub_sub = lb[col_index], ub[col_index]
+            with np.errstate(invalid="ignore"):
+                max_activity = positive @ ub_sub + negative @ lb_sub
+                min_activity = positive @ lb_sub + negative @ ub_sub
+            b_keep = b[row_index[keep]]
+            if (min_activity > b_keep + tol).any():
+                status = "Infeasible"
+                break
+            redundant = max_activity <= b_keep + tol
+            if redundant.any():
+                rows[row_index[np.flatnonzero(keep)[redundant]]] = False
+                report["redundant_rows"] += int(redundant.sum())
+                changed = True
+
+        # 4. 被支配列：目标和约束都"希望"变量取下界（或上界）
+        S_csc = S.tocsc()
+        col_nnz = np.diff(S_csc.indptr)
+        has_entries = col_nnz > 0
+        col_min = np.zeros(len(col_index))
+        col_max = np.zeros(len(col_index))
+        if has_entries.any():
+            col_min[has_entries] = S_csc.min(axis=0).toarray().ravel()[has_entries]
+            col_max[has_entries] = S_csc.max(axis=0).toarray().ravel()[has_entries]
+        cost_sub = cost[col_index]
+        lb_sub, ub_sub = lb[col_index], ub[col_index]
+        not_fixed = ub_sub - lb_sub > tol
+        to_lower = (cost_sub >= 0) & (col_min >= 0) & np.isfinite(lb_sub) & not_fixed
+        to_upper = (
+            (cost_sub <= 0) & (col_max <= 0) & np.isfinite(ub_sub) & not_fixed & ~to_lower
+        )
+        if to_lower.any() or to_upper.any():
+            ub[col_index[to_lower]] = lb[col_index[to_lower]]
+            lb[col_index[to_upper]] = ub[col_index[to_upper]]
+            report["dominated_cols"] += int(to_lower.sum() + to_upper.sum())
+            changed = True
+
+        # 5. 固定列代入后删除
+        fixed = np.flatnonzero(cols & (ub - lb <= tol))
+        if fixed.size:
+            values = lb[fixed]
+            fixed_values[fixed] = values
+            b -= A[:, fixed] @ values
+            offset += float(c[fixed] @ values)
+            cols[fixed] = False
+            report["fixed_cols"] += int(fixed.size)
+            changed = True
+
+    row_index = np.flatnonzero(rows)
+    col_index = np.flatnonzero(cols)
+    report["rows_removed"] = m - len(row_index)
+    report["cols_removed"] = n - len(col_index)
+
+    return {
+        "status": status,
+        "c": c[col_index],
+        "A_ub": A[row_index][:, col_index],
+        "b_ub": b[row_index],
+        "bounds": _to_bounds_list(lb[col_index], ub[col_index]),
+        "offset": offset,
+        "row_index": row_index,
+        "col_index": col_index,
+        "fixed_values": fixed_values,
+        "report": report,
+    }
+
+
+def postsolve_lp(presolved, x_reduced):
+    """
+    将化简后模型的解还原为原模型的解
+
+    参数:
+    presolved - presolve_lp 的返回值
+    x_reduced - 化简后模型的最优解
+
+    返回:
+    x - 原模型的解
+    """
+    x = presolved["fixed_values"].copy()
+    x[presolved["col_index"]] = x_reduced
+    return x
+
+
+def format_presolve_report(presolved):
+    """
+    生成预处理结果的说明文字
+
+    参数:
+    presolved - presolve_lp 的返回值
+
+    返回:
+    说明文字
+    """
+    report = presolved["report"]
+    return (
+        f"预处理删除 {report['rows_removed']} 行、{report['cols_removed']} 列 "
+        f"(空行 {report['empty_rows']}, 单变量行 {report['singleton_rows']}, "
+        f"冗余行 {report['redundant_rows']}, 被支配列 {report['dominated_cols']}, "
+        f"固定列 {report['fixed_cols']})"
+    )
@@ -1,8 +1,14 @@
+import os
+import sys
 import numpy as np
 
 #题目不要求求解 可以删除
 from scipy.optimize import linprog
 
+# 预处理模块在 final/code 目录下
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "final", "code"))
+from lp_presolve import presolve_lp, postsolve_lp, format_presolve_report
+
 # 数据点 (a) 数据集
 x = np.array([1.0, 2.3, 3.7, 4.2, 6.1, 7.0])
 y = np.array([3.6, 3.0, 3.2, 5.1, 5.3, 6.8])
@@ -29,11 +35,16 @@ b_ub = np.concatenate([b1, b2])
 # 定义变量边界：a, b 无界，t >= 0
 bounds = [(None, None), (None, None), (0, None)]
 
+# 先做预处理（删除单变量行、冗余行等），再对化简后的模型求解
+presolved = presolve_lp(c, A_ub, b_ub, bounds=bounds, maximize=False)
+print(format_presolve_report(presolved))
+
 # 使用 linprog 求解，该方法直接支持无界变量
-result = linprog(c, A_ub=A_ub, b_ub=b_ub, bounds=bounds, method='highs')
+result = linprog(presolved["c"], A_ub=presolved["A_ub"], b_ub=presolved["b_ub"],
+                 bounds=presolved["bounds"], method='highs')
 
 if result.success:
-    a, b, t = result.x
+    a, b, t = postsolve_lp(presolved, result.x)
     print("最优解：")
     print("a =", a)
     print("b =", b)
@@ -0,0 +1,407 @@
+import numpy as np
+
+"""
+二维线性规划的几何解法工具
+
+约束统一写成半平面形式 a*x + b*y <= c，例如：
+   x + y ≤ 6   ->  ( 1,  1,  6)
+   x + y ≥ 6   ->  (-1, -1, -6)
+   x ≥ 0       ->  (-1,  0,  0)
+
+1. halfplane_intersection：按方向角排序后用双端队列求半平面交，O(n log n)，
+   得到可行域多边形（逆时针顶点），并判断可行域为空、有界还是无界。
+2. solve_lp_2d：在可行域顶点上比较目标函数值，给出最优顶点；
+   若最优值在一条边的两个端点上同时取得，则给出最优边；目标函数无界时给出提示。
+3. solve_lp_seidel：Seidel 随机增量算法，期望 O(n)，只求最优点，不构造整个可行域。
+4. solve_lp_2d_batch：把许多个同样规模的小问题叠成数组，一次性向量化求解，
+   适合成千上万个"变量只有两个、约束很多"的小线性规划。
+"""
+
+# 包围盒半宽：可行域无界时用它截断，碰到包围盒的顶点说明可行域在该方向无界
+BOX = 1e7
+EPS = 1e-9
+
+
+def _normalize(A, b):
+    """将 a*x + b*y <= c 的法向量单位化，返回法向量、右端项"""
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).ravel()
+    norm = np.hypot(A[:, 0], A[:, 1])
+    if np.any(norm == 0):
+        # 0*x + 0*y <= c：c >= 0 时恒成立，否则无解
+        if np.any(b[norm == 0] < 0):
+            return None, None
+        A, b, norm = A[norm > 0], b[norm > 0], norm[norm > 0]
+    return A / norm[:, None], b / norm
+
+
+def _line_intersection(p1, d1, p2, d2):
+    """两条直线 p1 + t*d1 与 p2 + s*d2 的交点"""
+    cross = d1[0] * d2[1] - d1[1] * d2[0]
+    t = ((p2[0] - p1[0]) * d2[1] - (p2[1] - p1[1]) * d2[0]) / cross
+    return p1 + t * d1
+
+
+def halfplane_intersection(A, b, box=BOX):
+    """
+    求半平面 A @ [x, y] <= b 的交
+
+    参数:
+    A - 约束系数，形状 (n, 2)
+    b - 右端项，形状 (n,)
+    box - 包围盒半宽，用于截断无界的可行域
+
+    返回:
+    字典，包含：
+    status - "empty"（空集）、"bounded"（有界多边形）或 "unbounded"（无界）
+    vertices - 逆时针排列的顶点，形状 (k, 2)；无界时是被包围盒截断后的多边形
+    on_box - 每个顶点是否位于包围盒上（无界方向上的人为顶点）
+    """
+    normals, offsets = _normalize(A, b)
+    empty = {"status": "empty", "vertices": np.zeros((0, 2)), "on_box": np.zeros(0, dtype=bool)}
+    if normals is None:
+        return empty
+
+    # 加入包围盒的四条边
+    normals = np.vstack([normals, [[1, 0], [0, 1], [-1, 0], [0, -1]]])
+    offsets = np.concatenate([offsets, [box, box, box, box]])
+
+    # 半平面 n·q <= c 写成"点 p + 方向 d，可行域在 d 的左侧"
+    directions = np.column_stack([-normals[:, 1], normals[:, 0]])
+    points = normals * offsets[:, None]
+    angles = np.arctan2(directions[:, 1] + 0.0, directions[:, 0] + 0.0)
+
+    # 按方向角排序，方向相同的只保留最严格（右端项最小）的一个
+    order = np.lexsort((offsets, angles))
+    angles = angles[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = np.abs(np.diff(angles)) > EPS
+    order = order[keep]
+    points, directions = points[order], directions[order]
+
+    def outside(k, q):
+        d, p = directions[k], points[k]
+        return d[0] * (q[1] - p[1]) - d[1] * (q[0] - p[0]) < -EPS
+
+    def meet(i, j):
+        return _line_intersection(points[i], directions[i], points[j], directions[j])
+
+    dq = []
+    head = 0  # 用列表加头指针模拟双端队列
+    for k in range(len(order)):
+        while len(dq) - head > 1 and outside(k, meet(dq[-1], dq[-2])):
+            dq.pop()
+        while len(dq) - head > 1 and outside(k, meet(dq[head], dq[head + 1])):
+            head += 1
+        if len(dq) - head > 0:
+            last = dq[-1]
+            cross = directions[k][0] * directions[last][1] - directions[k][1] * directions[last][0]
+            if abs(cross) < EPS and directions[k] @ directions[last] < 0:
+                # 方向相反的平行半平面
+                if outside(k, points[last]) or outside(last, points[k]):
+                    return empty
+        dq.append(k)
+
+    while len(dq) - head > 2 and outside(dq[head], meet(dq[-1], dq[-2])):
+        dq.pop()
+    while len(dq) - head > 2 and outside(dq[-1], meet(dq[head], dq[head + 1])):
+        head += 1
+    dq = dq[head:]
+    if len(dq) < 3:
+        return empty
+
+    vertices = np.array([meet(dq[i], dq[(i + 1) % len(dq)]) for i in range(len(dq))]) + 0.0
+    # 检查所有原始半平面（防止数值误差导致的退化结果）
+    if np.any(normals @ vertices.T > offsets[:, None] + 1e-6 * (1 + np.abs(offsets[:, None]))):
+        return empty
+
+    on_box = np.any(np.abs(vertices) >= box * (1 - 1e-9), axis=1)
+    return {
+        "status": "unbounded" if on_box.any() else "bounded",
+        "vertices": vertices,
+        "on_box": on_box,
+    }
+
+
+def _has_ascent_ray(c, normals):
+    """
+    判断可行域的回收锥 {d : normals @ d <= 0} 中是否有使 c·d > 0 的方向
+
+    单位圆上 c·d 的最大值要么在 c 本身的方向取得（c 在锥内），
+    要么在锥的边界射线上取得，而边界射线一定与某个约束的直线平行，
+    所以只需检查 c 的方向和各约束直线的两个方向。
+
+    参数:
+    c - 最大化的目标函数系数 (cx, cy)
+    normals - 单位化后的约束法向量，形状 (n, 2)
+
+    返回:
+    True 表示目标函数在可行域上无界
+    """
+    norm = np.hypot(c[0], c[1])
+    if norm == 0:
+        return False
+    along = np.column_stack([-normals[:, 1], normals[:, 0]])
+    candidates = np.vstack([c / norm, along, -along])
+    inside = np.all(normals @ candidates.T <= EPS, axis=0)
+    return bool(np.any(candidates[inside] @ c > EPS * norm))
+
+
+def solve_lp_2d(c, A, b, maximize=True, box=BOX):
+    """
+    几何法求解二维线性规划 max/min c·[x, y], A @ [x, y] <= b
+
+    参数:
+    c - 目标函数系数 (cx, cy)
+    A, b - 约束，含义同 halfplane_intersection
+    maximize - True 为最大化
+    box - 包围盒半宽
+
+    返回:
+    字典，包含：
+    status - "Optimal"、"Infeasible" 或 "Unbounded"
+    x - 最优点；最优值在整条射线或直线上取得且没有有限顶点时，取其上离原点最近的点
+    value - 最优目标值
+    edge - 最优值在整条边（或射线、直线）上取得时为它的两个端点 (2, 2)，
+           射线、直线被包围盒截断，端点在包围盒上；否则为 None
+    region - 可行域信息（halfplane_intersection 的返回值）
+    """
+    region = halfplane_intersection(A, b, box)
+    if region["status"] == "empty":
+        return {"status": "Infeasible", "x": None, "value": None, "edge": None, "region": region}
+
+    sign = 1.0 if maximize else -1.0
+    c = sign * np.asarray(c, dtype=float)
+    # 是否无界只看回收方向，不看最优顶点是否落在包围盒上
+    normals, offsets = _normalize(A, b)
+    if _has_ascent_ray(c, normals):
+        return {"status": "Unbounded", "x": None, "value": None, "edge": None, "region": region}
+
+    vertices = region["vertices"]
+    on_box = region["on_box"]
+    values = vertices @ c
+    # 包围盒上的顶点坐标是 box 量级，目标值的舍入误差也随顶点坐标放大
+    tol = EPS * (1 + abs(values.max())) + 1e-12 * np.abs(c).sum() * np.abs(vertices).max(axis=1)
+    tied = np.flatnonzero(values >= values.max() - tol)
+    finite = tied[~on_box[tied]]
+
+    k = len(vertices)
+    edge = None
+    if finite.size:
+        best = int(finite[0])
+        x = vertices[best]
+        for neighbor in ((best - 1) % k, (best + 1) % k):
+            if neighbor in tied:
+                edge = vertices[[best, neighbor]]
+                break
+    elif np.any(c):
+        # 最优值在一整条直线上取得，两端都被包围盒截断；
+        # 这条直线就是法向量与 c 同向的约束，取其上离原点最近的点
+        i = int(np.argmax(normals @ c))
+        x = normals[i] * offsets[i]
+        edge = vertices[[tied[0], tied[-1]]]
+    else:
+        # 目标函数为0，任一可行点都最优
+        x = vertices[np.argmin(np.hypot(vertices[:, 0], vertices[:, 1]))]
+
+    return {
+        "status": "Optimal",
+        "x": x + 0.0,
+        "value": float(c @ x) * sign,
+        "edge": edge,
+        "region": region,
+    }
+
+
+def _violated(a, off, v):
+    """判断点 v 是否违反约束 a·q <= off（相对容差）"""
+    av = np.einsum("...j,...j->...", a, v)
+    return av - off > EPS * (1 + np.abs(off) + np.abs(av))
+
+
+def _solve_on_line(c, a, off, prev_n, prev_off):
+    """
+    在直线 a·q = off 上，受此前加入的约束 prev_n·q <= prev_off 限制，求一维线性规划
+
+    参数:
+    c - 最大化的目标函数系数，形状 (r, 2)
+    a, off - 新加入的约束，形状 (r, 2)、(r,)
+    prev_n, prev_off - 此前加入的约束，形状 (r, i, 2)、(r, i)
+
+    返回:
+    q - 一维问题的最优点，形状 (r, 2)
+    empty - 直线上的可行区间是否为空，形状 (r,)
+    """
+    # 直线参数化为 q = p + t*d
+    p = a * off[:, None]
+    d = np.column_stack([-a[:, 1], a[:, 0]])
+    nd = np.einsum("kij,kj->ki", prev_n, d)
+    rhs = prev_off - np.einsum("kij,kj->ki", prev_n, p)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = rhs / nd
+    lo = np.where(nd < -EPS, ratio, -np.inf).max(axis=1)
+    hi = np.where(nd > EPS, ratio, np.inf).min(axis=1)
+    parallel_bad = ((np.abs(nd) <= EPS) & (rhs < -EPS * (1 + np.abs(prev_off)))).any(axis=1)
+    empty = parallel_bad | (lo > hi + EPS * (1 + np.abs(lo) + np.abs(hi)))
+
+    # 沿 d 方向目标增大取 hi，减小取 lo，与 d 垂直时取离原点最近的点
+    slope = np.einsum("kj,kj->k", c, d)
+    t = np.clip(-np.einsum("kj,kj->k", p, d), lo, hi)
+    t = np.where(slope > EPS, hi, np.where(slope < -EPS, lo, t))
+    return p + t[:, None] * d, empty
+
+
+def _seidel_batch(c, normals, offsets, box, rng):
+    """
+    Seidel 随机增量算法：按随机顺序依次加入约束，当前最优点满足新约束时不变，
+    否则新的最优点一定在新约束的直线上，只需解一个一维线性规划。
+    第 i 个约束引起重新求解的概率不超过 2/i，所以期望总时间为 O(n)。
+
+    所有问题共用同一个随机顺序，每一步只对违反当前约束的那部分问题做向量运算；
+    只有一个问题时直接向量化地找出下一个被违反的约束，跳过中间满足的约束。
+
+    参数:
+    c - 最大化的目标函数系数，形状 (k, 2)
+    normals - 单位化后的约束法向量，形状 (k, n, 2)（零行表示不起作用的约束）
+    offsets - 右端项，形状 (k, n)
+    box - 包围盒半宽
+    rng - 随机数生成器
+
+    返回:
+    v - 最优点，形状 (k, 2)
+    feasible - 每个问题是否可行，形状 (k,)
+    """
+    k, n = offsets.shape
+    order = rng.permutation(n)
+    # 包围盒的四条边放在最前面，初始最优点就是包围盒上使目标最大的角点；
+    # 某个方向目标系数为0时取0，相当于在并列最优点中取离原点最近的点，保证最优点唯一
+    box_normals = np.broadcast_to(np.array([[1.0, 0], [0, 1], [-1, 0], [0, -1]]), (k, 4, 2))
+    normals = np.concatenate([box_normals, normals[:, order]], axis=1)
+    offsets = np.concatenate([np.full((k, 4), float(box)), offsets[:, order]], axis=1)
+    v = box * np.sign(c)
+    feasible = np.ones(k, dtype=bool)
+
+    if k == 1:
+        i = 4
+        while i < n + 4:
+            hit = np.flatnonzero(_violated(normals[0, i:], offsets[0, i:], v[0]))
+            if hit.size == 0:
+                break
+            i += int(hit[0])
+            q, empty = _solve_on_line(
+                c, normals[:, i], offsets[:, i], normals[:, :i], offsets[:, :i]
+            )
+            if empty[0]:
+                feasible[0] = False
+                break
+            v = q
+            i += 1
+        return v, feasible
+
+    for i in range(4, n + 4):
+        rows = np.flatnonzero(feasible & _violated(normals[:, i], offsets[:, i], v))
+        if rows.size == 0:
+            continue
+        q, empty = _solve_on_line(
+            c[rows], normals[rows, i], offsets[rows, i], normals[rows, :i], offsets[rows, :i]
+        )
+        v[rows] = np.where(empty[:, None], v[rows], q)
+        feasible[rows[empty]] = False
+
+    return v, feasible
+
+
+def solve_lp_2d_batch(c, A, b, maximize=True, box=BOX, seed=None):
+    """
+    批量求解许多个相互独立的二维线性规划 max/min c_k·[x, y], A_k @ [x, y] <= b_k
+
+    各问题的约束个数需要相同，不足的用全0行（0*x + 0*y <= 0）补齐。
+    循环只发生在约束上，每一步对所有问题同时做向量运算，没有逐个问题的 Python 开销。
+
+    参数:
+    c - 目标函数系数，形状 (k, 2)，或形状 (2,) 表示所有问题共用
+    A - 约束系数，形状 (k, n, 2)
+    b - 右端项，形状 (k, n)
+    maximize - True 为最大化
+    box - 包围盒半宽，最优点落在包围盒上视为无界
+    seed - 随机种子
+
+    返回:
+    字典，包含：
+    status - 每个问题的状态 "Optimal"、"Infeasible" 或 "Unbounded"，形状 (k,)
+    x - 最优点，形状 (k, 2)，非最优的问题为 nan
+    value - 最优目标值，形状 (k,)，非最优的问题为 nan
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if A.ndim == 2:
+        A, b = A[None], b[None]
+    k = A.shape[0]
+    c = np.broadcast_to(np.asarray(c, dtype=float), (k, 2))
+    sign = 1.0 if maximize else -1.0
+
+    norm = np.hypot(A[..., 0], A[..., 1])
+    zero = norm == 0
+    # 0*x + 0*y <= c：c < 0 时问题不可行，否则这一行不起作用
+    trivially_empty = (zero & (b < 0)).any(axis=1)
+    safe = np.where(zero, 1.0, norm)
+    normals = np.where(zero[..., None], 0.0, A / safe[..., None])
+    offsets = np.where(zero, np.abs(b), b / safe)
+
+    v, feasible = _seidel_batch(sign * c, normals, offsets, box, np.random.default_rng(seed))
+    feasible &= ~trivially_empty
+    unbounded = feasible & np.any(np.abs(v) >= box * (1 - 1e-9), axis=1)
+    optimal = feasible & ~unbounded
+
+    status = np.where(optimal, "Optimal", np.where(unbounded, "Unbounded", "Infeasible"))
+    x = np.where(optimal[:, None], v + 0.0, np.nan)
+    return {
+        "status": status,
+        "x": x,
+        "value": np.einsum("kj,kj->k", c, x),
+    }
+
+
+def solve_lp_seidel(c, A, b, maximize=True, box=BOX, seed=None):
+    """
+    用 Seidel 随机增量算法求解单个二维线性规划，期望时间 O(n)
+
+    参数:
+    c, A, b, maximize, box - 含义同 solve_lp_2d
+    seed - 随机种子
+
+    返回:
+    字典，包含：
+    status - "Optimal"、"Infeasible" 或 "Unbounded"
+    x - 最优点（并列时取离原点最近的一个）
+    value - 最优目标值
+    """
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).ravel()
+    result = solve_lp_2d_batch(c, A[None], b[None], maximize, box, seed)
+    if result["status"][0] != "Optimal":
+        return {"status": str(result["status"][0]), "x": None, "value": None}
+    return {
+        "status": "Optimal",
+        "x": result["x"][0],
+        "value": float(result["value"][0]),
+    }
+
+
+if __name__ == "__main__":
+    # 最优面上没有有限顶点（只在包围盒上有顶点）的有界问题：与 Seidel 算法对照
+    cases = [
+        ("max -x, -x <= -1", [-1, 0], [[-1, 0]], [-1], -1.0),
+        ("max 2x-2y, 5x-5y <= -1", [2, -2], [[5, -5]], [-1], -0.4),
+    ]
+    for name, c, A, b, expected in cases:
+        result = solve_lp_2d(c, A, b)
+        seidel = solve_lp_seidel(c, A, b, seed=0)
+        print(f"{name}: {result['status']}, x = {result['x']}, 最优值 = {result['value']:.6g}")
+        assert result["status"] == seidel["status"] == "Optimal"
+        assert abs(result["value"] - expected) < 1e-9 and abs(seidel["value"] - expected) < 1e-9
+
+    # 真正无界的问题仍判为无界
+    result = solve_lp_2d([1, 0], [[-1, 0]], [-1])
+    print(f"max x, -x <= -1: {result['status']}")
+    assert result["status"] == "Unbounded"
@@ -1,11 +1,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Polygon
+from lp2d import solve_lp_2d
 
 """
 numpy:用于数值计算和生成等差数列（如 np.linspace,方便画直线和处理坐标。
 matplotlib.pyplot:用于绘图,画出直线、点、区域、图例等,是Python最常用的可视化库。
 matplotlib.patches.Polygon:用于在图中绘制多边形(如可行域的阴影区域)，让可行解区域一目了然。
+lp2d.solve_lp_2d:用半平面交自动求出可行域多边形和最优解，不再手工计算交点。
 """
 
 # 设置绘图字体支持中文
@@ -68,37 +70,27 @@ plt.plot(x, y2, "g-", label="3x - y = 9")
 plt.axhline(y=0, color="k", linestyle="-")
 plt.axvline(x=0, color="k", linestyle="-")
 
-# 计算交点
-# x + y = 6 和 x = 0 的交点
-p1 = (0, 6)
-# x + y = 6 和 y = 0 的交点
-p2 = (6, 0)
-# 3x - y = 9 和 y = 0 的交点
-p3 = (3, 0)
-# x + y = 6 和 3x - y = 9 的交点
-# 解方程组：x + y = 6, 3x - y = 9
-# 4x = 15, x = 3.75, y = 2.25
-p4 = (3.75, 2.25)
-
-# 标注交点坐标
+# 约束条件统一写成 A @ [x, y] <= b 的形式：
+# x + y <= 6, 3x - y <= 9, -x <= 0, -y <= 0
+A = np.array([[1, 1], [3, -1], [-1, 0], [0, -1]])
+b = np.array([6, 9, 0, 0])
+
+# 求可行域（半平面交）并在顶点中找出最优解
+result = solve_lp_2d([1, 1], A, b, maximize=True)
+vertices = result["region"]["vertices"]
+
+# 标注可行域的各个顶点
 """
 "r" 表示 红色（red）
 "o" 表示 圆形标记（circle marker）
 所以 "ro" 的意思是：用红色绘制圆形点。
 """
-plt.plot(p1[0], p1[1], "ro")
-plt.plot(p2[0], p2[1], "ro")
-plt.plot(p3[0], p3[1], "ro")
-plt.plot(p4[0], p4[1], "ro")
-
-plt.text(p1[0], p1[1] + 0.2, f"({p1[0]}, {p1[1]})", fontsize=10)
-plt.text(p2[0], p2[1] + 0.2, f"({p2[0]}, {p2[1]})", fontsize=10)
-plt.text(p3[0], p3[1] + 0.2, f"({p3[0]}, {p3[1]})", fontsize=10)
-plt.text(p4[0], p4[1] + 0.2, f"({p4[0]:.2f}, {p4[1]:.2f})", fontsize=10)
+for vx, vy in vertices:
+    plt.plot(vx, vy, "ro")
+    plt.text(vx, vy + 0.2, f"({vx:g}, {vy:g})", fontsize=10)
 
 # 标注可行域（只在可行区域绘制颜色）
-points = [(0, 0), (0, 6), (3.75, 2.25), (3, 0)]
-poly = Polygon(points, alpha=0.3, color="skyblue")
+poly = Polygon(vertices, alpha=0.3, color="skyblue")
 """
 alpha=0.3 表示绘制的多边形具有 30% 的不透明度，即 70% 的透明度。
 alpha 的取值范围是 [0, 1]：
@@ -108,13 +100,12 @@ alpha 的取值范围是 [0, 1]：
 ax.add_patch(poly)
 
 # 仅绘制最优目标函数等值线（一条虚线）
-max_value = p4[0] + p4[1]  # 6
+max_value = result["value"]  # 6
 y_obj = max_value - x
-# 这里x+y=6.0是浮点数计算结果（如3.75+2.25），所以显示为6.0
-plt.plot(x, y_obj, "r--", alpha=0.7, linewidth=1.5, label=f"x + y = {max_value}")
+plt.plot(x, y_obj, "r--", alpha=0.7, linewidth=1.5, label=f"x + y = {max_value:g}")
 
 # 标出最优解
-max_point = p4  # (3.75, 2.25)
+max_point = result["x"]  # (3.75, 2.25)
 plt.plot(max_point[0], max_point[1], "ro", markersize=8)
 plt.text(
     max_point[0] - 1.5,
@@ -131,6 +122,10 @@ plt.text(
     fontsize=12,
 )
 
+# 最优值在一条边上取得时，把这条边也画出来
+if result["edge"] is not None:
+    plt.plot(result["edge"][:, 0], result["edge"][:, 1], "r-", linewidth=3, alpha=0.5, label="最优边")
+
 # 添加图例和标题
 plt.legend(loc="upper right")
 # 所有设置了 label 的图形元素会在调用 plt.legend() 时被汇总，并生成图例。
@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Polygon
+from lp2d import halfplane_intersection, solve_lp_2d
 
 # 设置字体支持中文
 plt.rcParams["font.sans-serif"] = ["SimHei"]  # 使用SimHei字体
@@ -53,60 +54,40 @@ plt.plot(x, y2, "g-", label="3x - y = 9")
 plt.axhline(y=0, color="k", linestyle="-")
 plt.axvline(x=0, color="k", linestyle="-")
 
-# 计算交点
-# x + y = 6 和 3x - y = 9 的交点
-# 解方程组：x + y = 6, 3x - y = 9
-# 4x = 15, x = 3.75, y = 2.25
-p1 = (3.75, 2.25)
+# 约束条件统一写成 A @ [x, y] <= b 的形式（≥ 约束两边同乘 -1）：
+# -x - y <= -6, -3x + y <= -9, -x <= 0, -y <= 0
+A = np.array([[-1, -1], [-3, 1], [-1, 0], [0, -1]])
+b = np.array([-6, -9, 0, 0])
 
-# x + y = 6 和 y = 0 的交点
-p2 = (6, 0)
-
-# 3x - y = 9 与 y = 8 的交点
-# 3x - 8 = 9
-# 3x = 17
-# x = 5.67
-p3 = (5.67, 8)
-
-# 标注交点坐标
-plt.plot(p1[0], p1[1], "ro")
-plt.plot(p2[0], p2[1], "ro")
-plt.plot(p3[0], p3[1], "ro")
+# 可行域向右上方无界，作图时再加上 x <= 8、y <= 8 截断到显示范围内
+view = halfplane_intersection(
+    np.vstack([A, [[1, 0], [0, 1]]]), np.concatenate([b, [x_max, y_max]])
+)
+vertices = view["vertices"]
 
-plt.text(p1[0], p1[1] + 0.2, f"({p1[0]:.2f}, {p1[1]:.2f})", fontsize=10)
-plt.text(p2[0], p2[1] + 0.2, f"({p2[0]}, {p2[1]})", fontsize=10)
-plt.text(p3[0], p3[1] + 0.2, f"({p3[0]:.2f}, {p3[1]})", fontsize=10)
+# 标注可行域的各个顶点
+for vx, vy in vertices:
+    plt.plot(vx, vy, "ro")
+    plt.text(vx, vy + 0.2, f"({vx:.2f}, {vy:.2f})", fontsize=10)
 
 # 标注可行域（只在可行区域绘制颜色）
 # min问题的可行域为同时满足x+y≥6和3x-y≥9的区域（第一象限内）
-vertices = [
-    (p1[0], p1[1]),  # (3.75, 2.25)
-    (p2[0], p2[1]),  # (6, 0)
-    (8, 0),  # 右下角点
-    (8, 8),  # 右上角点
-    (p3[0], p3[1]),  # (5.67, 8)
-]
 poly = Polygon(vertices, alpha=0.3, color="skyblue")
 ax.add_patch(poly)
 
-# 计算目标函数在各个顶点的值
-vertices_values = {}
-vertices_values[p1] = p1[0] + p1[1]  # (3.75, 2.25) -> 6
-vertices_values[p2] = p2[0] + p2[1]  # (6, 0) -> 6
-vertices_values[p3] = p3[0] + p3[1]  # (5.67, 8) -> 13.67
-vertices_values[(8, 0)] = 8 + 0  # (8, 0) -> 8
-vertices_values[(8, 8)] = 8 + 8  # (8, 8) -> 16
-
-# 找出最小值和对应点
-min_value = min(vertices_values.values())  # 6
-min_points = [point for point, value in vertices_values.items() if value == min_value]
+# 用真实约束（不加显示范围）求最优解：可行域无界，但目标函数有下界
+result = solve_lp_2d([1, 1], A, b, maximize=False)
+min_value = result["value"]  # 6
+# 最优值在 (3.75, 2.25) 和 (6, 0) 之间的边上均可取得，result["x"] 是其中一个端点
+min_point = result["x"]
 
-# 两个最小值点，可以选择其中一个
-min_point = p1  # 选择(3.75, 2.25)作为最优解点
+# 最优边
+if result["edge"] is not None:
+    plt.plot(result["edge"][:, 0], result["edge"][:, 1], "r-", linewidth=3, alpha=0.5, label="最优边")
 
 # 绘制最优目标函数等值线（一条虚线）
 y_obj = min_value - x
-plt.plot(x, y_obj, "r--", alpha=0.7, linewidth=1.5, label=f"x + y = {min_value}")
+plt.plot(x, y_obj, "r--", alpha=0.7, linewidth=1.5, label=f"x + y = {min_value:g}")
 
 # 标出最优解
 plt.plot(min_point[0], min_point[1], "ro", markersize=8)
@@ -120,7 +101,7 @@ plt.text(
 plt.text(
     min_point[0] - 1.5,
     min_point[1] + 0.1,
-    f"目标函数值: {min_value}",
+    f"目标函数值: {min_value:g}",
     color="red",
     fontsize=12,
 )
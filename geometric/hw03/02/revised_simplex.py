@@ -0,0 +1,406 @@
+"""
+修正单纯形法 (Revised Simplex)，带 LU 分解更新与变量上下界
+
+求解：
+    最大化 (或最小化) z = c^T x
+    约束条件 A x <= b, lb <= x <= ub
+
+与单纯形表 (simplex.py) 相比：
+* 不保存整张单纯形表，只保存基矩阵 B 的 LU 分解。每次换基用乘积形式 (product form)
+  的 eta 向量更新 B^{-1}，每隔若干次换基重新做一次 LU 分解，控制 eta 文件长度与误差积累。
+  每次迭代只做一次 FTRAN (B^{-1} a_j) 和一次 BTRAN (B^{-T} c_B)，
+  代价取决于基矩阵的规模和稀疏程度，而不是整张表的大小。
+* 直接处理变量上下界：非基变量停在某个边界上，比值检验同时考虑基变量的上下界
+  和进入变量自身的"边界翻转"，不需要像 y = x2 + 5 那样手工替换变量，也不需要额外的约束行。
+* 初始基不可行时（b - A x_N 有负分量），为这些行加入人工变量先做第一阶段。
+"""
+
+import os
+import sys
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+# 变量边界的格式与 final/code 下的求解器保持一致
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "final", "code"))
+from lp_presolve import normalize_bounds
+
+
+def factorize(A, basis):
+    """
+    对基矩阵做 LU 分解
+
+    参数:
+    A - 约束矩阵（csc格式，已含松弛变量列）
+    basis - 基变量下标数组
+
+    返回:
+    factor - 字典，lu 为 splu 分解对象，etas 为此后累积的 eta 向量列表 [(r, alpha), ...]
+    """
+    return {"lu": splu(sparse.csc_matrix(A[:, basis])), "etas": []}
+
+
+def ftran(factor, a):
+    """计算 B^{-1} a：先用 LU 求解，再依次作用 eta 变换"""
+    v = factor["lu"].solve(np.asarray(a, dtype=float))
+    for r, alpha in factor["etas"]:
+        v_r = v[r] / alpha[r]
+        v -= v_r * alpha
+        v[r] = v_r
+    return v
+
+
+def btran(factor, u):
+    """计算 B^{-T} u：先逆序作用 eta 变换的转置，再用 LU 的转置求解"""
+    u = np.array(u, dtype=float)
+    for r, alpha in reversed(factor["etas"]):
+        u[r] = (u[r] - (alpha @ u - alpha[r] * u[r])) / alpha[r]
+    return factor["lu"].solve(u, trans="T")
+
+
+def nonbasic_value(low, high):
+    """非基变量的取值：优先取有限的下界，其次上界，自由变量取0"""
+    return np.where(np.isfinite(low), low, np.where(np.isfinite(high), high, 0.0))
+
+
+def build_model(c, A_ub, b_ub, bounds=None, maximize=True):
+    """
+    加入松弛变量，构造修正单纯形法使用的等式形式模型
+
+    A x + s = b，s >= 0；目标统一转为最小化
+
+    返回:
+    model - 字典，包含 A（csc, m x (n+m)）、b、cost、lb、ub、n、m、sign
+    """
+    c = np.asarray(c, dtype=float)
+    A = sparse.csc_array(A_ub, dtype=float)
+    m, n = A.shape
+    lb, ub = normalize_bounds(bounds, n)
+    sign = -1.0 if maximize else 1.0
+    return {
+        "A": sparse.hstack([A, sparse.eye_array(m)], format="csc"),
+        "b": np.asarray(b_ub, dtype=float),
+        "cost": np.concatenate([sign * c, np.zeros(m)]),
+        "lb": np.concatenate([lb, np.zeros(m)]),
+        "ub": np.concatenate([ub, np.full(m, np.inf)]),
+        "n": n,
+        "m": m,
+        "sign": sign,
+    }
+
+
+def primal_simplex(model, state, cost, max_iter=10000, refactor_every=50, tol=1e-9, degenerate_limit=5):
+    """
+    有界变量的原始修正单纯形法迭代（原地更新 state）
+
+    参数:
+    model - build_model 返回的模型
+    state - 当前基：basis（基变量下标）、x（全部变量取值）、factor（基矩阵分解）
+    cost - 本阶段使用的目标系数（最小化）
+    max_iter - 最大迭代次数
+    refactor_every - 每隔多少次换基重新做 LU 分解
+    tol - 数值容差
+    degenerate_limit - 连续退化迭代达到该次数后改用 Bland 规则
+
+    返回:
+    status - "Optimal"、"Unbounded" 或 "Not Solved"
+    iterations - 迭代次数
+    """
+    A, lb, ub = model["A"], model["lb"], model["ub"]
+    basis, x = state["basis"], state["x"]
+    is_basic = np.zeros(A.shape[1], dtype=bool)
+    is_basic[basis] = True
+    degenerate = 0
+
+    for iteration in range(max_iter):
+        # BTRAN 求单纯形乘子，再求非基变量的检验数
+        y = btran(state["factor"], cost[basis])
+        d = cost - A.T @ y
+        can_increase = (d < -tol) & (x < ub - tol) & ~is_basic
+        can_decrease = (d > tol) & (x > lb + tol) & ~is_basic
+        candidates = np.flatnonzero(can_increase | can_decrease)
+        if candidates.size == 0:
+            state["y"] = y
+            return "Optimal", iteration
+
+        if degenerate >= degenerate_limit:
+            j = int(candidates[0])  # Bland 规则
+        else:
+            j = int(candidates[np.argmax(np.abs(d[candidates]))])  # Dantzig 规则
+        direction = 1.0 if d[j] < 0 else -1.0
+
+        # FTRAN：进入变量变化 t 时，基变量变化 -direction * t * alpha
+        alpha = ftran(state["factor"], A[:, [j]].toarray().ravel())
+        change = direction * alpha
+        xb = x[basis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            limits = np.where(
+                change > tol,
+                (xb - lb[basis]) / change,
+                np.where(change < -tol, (ub[basis] - xb) / -change, np.inf),
+            )
+        limits = np.maximum(limits, 0.0)
+        r = int(np.argmin(limits)) if limits.size else -1
+        step = limits[r] if limits.size else np.inf
+        # 进入变量到另一侧边界的距离从当前值算起（非基变量不一定恰好在边界上）
+        flip = ub[j] - x[j] if direction > 0 else x[j] - lb[j]
+
+        if flip <= step:
+            # 进入变量直接移到另一个边界，基不变
+            if not np.isfinite(flip):
+                return "Unbounded", iteration
+            x[j] += direction * flip
+            x[basis] = xb - flip * change
+            degenerate = 0
+            continue
+        if not np.isfinite(step):
+            return "Unbounded", iteration
+
+        degenerate = degenerate + 1 if step <= tol else 0
+        x[j] += direction * step
+        x[basis] = xb - step * change
+        leaving = basis[r]
+        # 退出变量停在它到达的边界上
+        x[leaving] = lb[leaving] if change[r] > 0 else ub[leaving]
+        basis[r] = j
+        is_basic[leaving] = False
+        is_basic[j] = True
+
+        state["factor"]["etas"].append((r, alpha))
+        if len(state["factor"]["etas"]) >= refactor_every:
+            state["factor"] = factorize(A, basis)
+            x[basis] = ftran(state["factor"], model["b"] - A[:, ~is_basic] @ x[~is_basic])
+
+    return "Not Solved", max_iter
+
+
+def solve_revised_simplex(c, A_ub, b_ub, bounds=None, maximize=True, max_iter=10000, refactor_every=50, tol=1e-9):
+    """
+    用修正单纯形法求解 max/min c^T x, A x <= b, lb <= x <= ub
+
+    参数:
+    c - 目标函数系数
+    A_ub - 不等式约束矩阵，numpy数组或scipy.sparse矩阵
+    b_ub - 右端项（可以为负）
+    bounds - 变量边界，None（默认 x >= 0）、单个 (lb, ub) 或 [(lb, ub), ...]，None表示无界
+    maximize - True 为最大化
+    max_iter - 每个阶段的最大迭代次数
+    refactor_every - 每隔多少次换基重新做 LU 分解
+    tol - 数值容差
+
+    返回:
+    字典，包含：
+    status - "Optimal"、"Infeasible"、"Unbounded" 或 "Not Solved"
+    x - 最优解
+    objective - 最优目标值
+    y - 约束的对偶变量（按原目标方向）
+    iterations - 两个阶段的总迭代次数
+    basis - 最优基（下标 >= n 的是松弛变量）
+    model, state - 供对偶单纯形法热启动使用的模型与基
+    """
+    model = build_model(c, A_ub, b_ub, bounds, maximize)
+    A, b, m, n = model["A"], model["b"], model["m"], model["n"]
+
+    # 初始基为松弛变量，非基的原变量停在边界上
+    x = nonbasic_value(model["lb"], model["ub"])
+    residual = b - A[:, :n] @ x[:n]
+    x[n:] = residual
+
+    # 松弛变量为负的行加入人工变量：A_i x + s_i - a_i = b_i，a_i >= 0
+    negative = np.flatnonzero(residual < -tol)
+    iterations = 0
+    if negative.size:
+        k = negative.size
+        artificial = sparse.csc_array(
+            (-np.ones(k), (negative, np.arange(k))), shape=(m, k)
+        )
+        model["A"] = sparse.hstack([A, artificial], format="csc")
+        model["cost"] = np.concatenate([model["cost"], np.zeros(k)])
+        model["lb"] = np.concatenate([model["lb"], np.zeros(k)])
+        model["ub"] = np.concatenate([model["ub"], np.full(k, np.inf)])
+        x = np.concatenate([x, -residual[negative]])
+        x[n + negative] = 0.0
+        basis = np.arange(n, n + m)
+        basis[negative] = n + m + np.arange(k)
+    else:
+        basis = np.arange(n, n + m)
+
+    state = {"basis": basis, "x": x, "factor": factorize(model["A"], basis)}
+
+    if negative.size:
+        # 第一阶段：最小化人工变量之和
+        phase1_cost = np.zeros(len(x))
+        phase1_cost[n + m:] = 1.0
+        status, it = primal_simplex(model, state, phase1_cost, max_iter, refactor_every, tol)
+        iterations += it
+        if status != "Optimal" or state["x"][n + m:].sum() > 1e-7 * (1 + np.abs(b).max()):
+            return {"status": "Infeasible", "x": None, "objective": None, "y": None,
+                    "iterations": iterations, "basis": state["basis"], "model": model, "state": state}
+        # 人工变量固定为0，留在模型中不影响第二阶段
+        model["ub"][n + m:] = 0.0
+
+    status, it = primal_simplex(model, state, model["cost"], max_iter, refactor_every, tol)
+    iterations += it
+    x_opt = state["x"][:n].copy()
+    return {
+        "status": status,
+        "x": x_opt,
+        "objective": model["sign"] * (model["cost"][:n] @ x_opt),
+        "y": None if status != "Optimal" else model["sign"] * state["y"],
+        "iterations": iterations,
+        "basis": state["basis"].copy(),
+        "model": model,
+        "state": state,
+    }
+
+
+def dual_simplex(model, state, max_iter=10000, refactor_every=50, tol=1e-9):
+    """
+    有界变量的对偶修正单纯形法迭代（原地更新 state）
+
+    要求当前基对偶可行（检验数符号与非基变量所在边界相符），基变量可以越界。
+    每次选越界最多的基变量出基（停在被违反的边界上），在对应的行中按
+    |检验数 / 行系数| 最小选择进入变量，保持对偶可行。
+
+    返回:
+    status - "Optimal"、"Infeasible" 或 "Not Solved"
+    iterations - 迭代次数
+    """
+    A, lb, ub, cost = model["A"], model["lb"], model["ub"], model["cost"]
+    basis, x = state["basis"], state["x"]
+    m = len(basis)
+    is_basic = np.zeros(A.shape[1], dtype=bool)
+    is_basic[basis] = True
+
+    for iteration in range(max_iter):
+        xb = x[basis]
+        below = lb[basis] - xb
+        above = xb - ub[basis]
+        infeasibility = np.maximum(below, above)
+        r = int(np.argmax(infeasibility))
+        if infeasibility[r] <= tol:
+            state["y"] = btran(state["factor"], cost[basis])
+            return "Optimal", iteration
+        to_lower = below[r] > 0
+        target = lb[basis[r]] if to_lower else ub[basis[r]]
+
+        # 第 r 行：e_r^T B^{-1} A
+        unit = np.zeros(m)
+        unit[r] = 1.0
+        rho = btran(state["factor"], unit)
+        row = A.T @ rho
+        y = btran(state["factor"], cost[basis])
+        d = cost - A.T @ y
+
+        # x_Br 随 x_j 的变化率为 -row_j；需要增大 x_Br 时，
+        # 可增大的 x_j (未达上界) 要求 row_j < 0，可减小的 x_j (未达下界) 要求 row_j > 0
+        need = 1.0 if to_lower else -1.0
+        can_increase = ~is_basic & (x < ub - tol) & (need * row < -tol)
+        can_decrease = ~is_basic & (x > lb + tol) & (need * row > tol)
+        candidates = np.flatnonzero(can_increase | can_decrease)
+        if candidates.size == 0:
+            return "Infeasible", iteration
+        j = int(candidates[np.argmin(np.abs(d[candidates] / row[candidates]))])
+
+        alpha = ftran(state["factor"], A[:, [j]].toarray().ravel())
+        delta = (xb[r] - target) / alpha[r]  # x_j 的变化量，使 x_Br 恰好到达边界
+        x[j] += delta
+        x[basis] = xb - delta * alpha
+        x[basis[r]] = target
+        is_basic[basis[r]] = False
+        is_basic[j] = True
+        basis[r] = j
+
+        state["factor"]["etas"].append((r, alpha))
+        if len(state["factor"]["etas"]) >= refactor_every:
+            state["factor"] = factorize(A, basis)
+            x[basis] = ftran(state["factor"], model["b"] - A[:, ~is_basic] @ x[~is_basic])
+
+    return "Not Solved", max_iter
+
+
+def reoptimize_dual(result, new_A=None, new_b=None, bounds=None, max_iter=10000, refactor_every=50, tol=1e-9):
+    """
+    在已求得的最优基上追加约束或修改变量边界，用对偶单纯形法重新优化
+
+    追加的约束以其松弛变量入基，修改边界后非基变量移到新的边界上；
+    原最优基仍然对偶可行，只需对偶单纯形法消除越界的基变量，
+    适合交互式建模与割平面循环，不必从头求解。
+
+    参数:
+    result - solve_revised_simplex 或 reoptimize_dual 的返回值（需为最优）
+    new_A - 追加约束的系数矩阵 (k x n)，约束为 new_A x <= new_b
+    new_b - 追加约束的右端项
+    bounds - {变量下标: (lb, ub)}，要修改的原变量边界，None 表示该侧无界
+    max_iter, refactor_every, tol - 同 solve_revised_simplex
+
+    返回:
+    与 solve_revised_simplex 相同格式的结果字典
+    """
+    model, state = result["model"], result["state"]
+    n, m = model["n"], model["m"]
+    A, x, basis = model["A"], state["x"].copy(), state["basis"].copy()
+    lb, ub = model["lb"].copy(), model["ub"].copy()
+
+    if bounds:
+        for j, (low, high) in bounds.items():
+            lb[j] = -np.inf if low is None else low
+            ub[j] = np.inf if high is None else high
+
+    if new_A is not None:
+        new_A = sparse.csr_array(new_A, dtype=float)
+        k = new_A.shape[0]
+        # 新行：[new_A, 0(原有松弛/人工变量), I(新松弛变量)]
+        extra = A.shape[1] - n
+        top = sparse.hstack([A, sparse.csc_array((m, k))])
+        bottom = sparse.hstack([new_A, sparse.csc_array((k, extra)), sparse.eye_array(k)])
+        A = sparse.vstack([top, bottom], format="csc")
+        model = dict(model)
+        model["b"] = np.concatenate([model["b"], np.asarray(new_b, dtype=float)])
+        model["cost"] = np.concatenate([model["cost"], np.zeros(k)])
+        lb = np.concatenate([lb, np.zeros(k)])
+        ub = np.concatenate([ub, np.full(k, np.inf)])
+        x = np.concatenate([x, np.zeros(k)])
+        basis = np.concatenate([basis, A.shape[1] - k + np.arange(k)])
+        m += k
+    else:
+        model = dict(model)
+
+    model.update({"A": A, "lb": lb, "ub": ub, "m": m})
+
+    # 非基变量按检验数的符号移到新的边界上（检验数为正取下界，为负取上界，
+    # 该侧无界时取另一侧），两侧都无界的自由变量保持原值；再由新的基重新计算基变量
+    is_basic = np.zeros(A.shape[1], dtype=bool)
+    is_basic[basis] = True
+    nonbasic = ~is_basic
+    state = {"basis": basis, "x": x, "factor": factorize(A, basis)}
+    d = model["cost"] - A.T @ btran(state["factor"], model["cost"][basis])
+    to_lower = np.where(
+        d > tol,
+        np.isfinite(lb),
+        np.where(d < -tol, ~np.isfinite(ub), np.abs(x - lb) <= np.abs(ub - x)),
+    )
+    target = np.where(to_lower & np.isfinite(lb), lb, np.where(np.isfinite(ub), ub, lb))
+    target = np.where(np.isfinite(target), target, x)
+    x[nonbasic] = target[nonbasic]
+    x[basis] = ftran(state["factor"], model["b"] - A[:, nonbasic] @ x[nonbasic])
+
+    status, iterations = dual_simplex(model, state, max_iter, refactor_every, tol)
+    if status == "Optimal":
+        # 边界放宽可能破坏对偶可行性，用原始单纯形法收尾（通常 0 次迭代）
+        status, it = primal_simplex(model, state, model["cost"], max_iter, refactor_every, tol)
+        iterations += it
+
+    x_opt = state["x"][:n].copy()
+    optimal = status == "Optimal"
+    return {
+        "status": status,
+        "x": x_opt if optimal else None,
+        "objective": model["sign"] * (model["cost"][:n] @ x_opt) if optimal else None,
+        "y": model["sign"] * state["y"] if optimal else None,
+        "iterations": iterations,
+        "basis": state["basis"].copy(),
+        "model": model,
+        "state": state,
+    }
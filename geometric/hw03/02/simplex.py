@@ -0,0 +1,523 @@
+"""
+通用单纯形表求解器 (Tableau Simplex)
+
+求解标准形式的线性规划：
+    最大化 (或最小化) z = c^T x
+    约束条件 A x <= b, x >= 0, 且 b >= 0
+引入松弛变量后，以松弛变量为初始基，反复选择进入变量和退出变量旋转，直到最优。
+
+* 进入变量：Dantzig 规则（检验数最负的列）；连续出现退化旋转时改用 Bland 规则防止循环。
+* 已求解的表可以追加新约束（割平面、收紧变量边界），再用对偶单纯形法从当前基重新优化，
+  不必从头求解。
+* 两种数值模式：
+  - exact=True：精确有理数运算。采用无分数整数旋转 (fraction-free / Bareiss 旋转)，
+    整张表只保存整数分子和一个公共分母，不为每个单元格创建 Fraction 对象。
+  - exact=False：float64 运算，用 numpy 整行更新。
+* 旋转记录 (pivot trace)：求解时只向预先分配的结构化数组追加每次旋转的
+  进入/退出变量、枢轴元素和目标值，不格式化任何表格；
+  任意一步的单纯形表都在需要显示时才由初始表重放旋转得到，因此可以在实际求解中常开记录。
+"""
+
+from fractions import Fraction
+from math import lcm
+
+import numpy as np
+from tabulate import tabulate
+
+# 旋转记录中每一条的字段：步数、类型(0 原始单纯形 / 1 对偶单纯形)、枢轴行、进入变量、退出变量、枢轴元素、旋转后的目标值
+TRACE_DTYPE = np.dtype(
+    [
+        ("step", np.int32),
+        ("kind", np.int8),
+        ("row", np.int32),
+        ("entering", np.int32),
+        ("leaving", np.int32),
+        ("pivot", np.float64),
+        ("objective", np.float64),
+    ]
+)
+
+
+def _integer_rows(rows):
+    """将每一行乘以其分母的最小公倍数，化为整数行；返回整数行和各行的倍数"""
+    int_rows, scales = [], []
+    for row in rows:
+        fracs = [Fraction(v) for v in row]
+        scale = lcm(*(f.denominator for f in fracs)) if fracs else 1
+        int_rows.append([int(f * scale) for f in fracs])
+        scales.append(scale)
+    return int_rows, scales
+
+
+# 浮点模式下判断正负的容差；精确模式不需要容差
+FLOAT_TOL = 1e-9
+
+
+def _tol(tableau):
+    return 0 if tableau["exact"] else FLOAT_TOL
+
+
+def build_tableau(c, A, b, maximize=True, exact=True):
+    """
+    构造初始单纯形表（以松弛变量为基）
+
+    参数:
+    c - 目标函数系数，长度 n
+    A - 约束系数矩阵 (m x n)，约束为 A x <= b
+    b - 右端项，长度 m，要求非负
+    maximize - True 为最大化，False 为最小化
+    exact - True 用精确有理数（无分数整数旋转），False 用 float64
+
+    返回:
+    tableau - 字典，包含：
+        T - (m+1) x (n+m+1) 数组，最后一行为目标行 (-c)，最后一列为右端项
+        denom - 公共分母（精确模式下表中真实数值为 T / denom；浮点模式恒为 1）
+        basis - 各约束行的基变量下标
+        n, m - 原变量个数与约束个数
+        exact - 数值模式
+        sign - 最大化为 1，最小化为 -1（目标行按最大化 sign*c 存储）
+        obj_scale - 精确模式下目标行的整数化倍数
+    """
+    A = [list(row) for row in A]
+    m, n = len(A), len(c)
+    sign = 1 if maximize else -1
+    if any(Fraction(v) < 0 for v in b):
+        raise ValueError("单纯形表要求右端项 b >= 0（初始基为松弛变量）")
+
+    rows = [A[i] + [1 if k == i else 0 for k in range(m)] + [b[i]] for i in range(m)]
+    obj = [-sign * v for v in c] + [0] * m + [0]
+
+    if exact:
+        rows, _ = _integer_rows(rows)
+        (obj,), (obj_scale,) = _integer_rows([obj])
+        T = np.array(rows + [obj], dtype=object)
+    else:
+        obj_scale = 1
+        T = np.array(rows + [obj], dtype=float)
+
+    return {
+        "T": T,
+        "denom": 1,
+        "basis": list(range(n, n + m)),
+        "n": n,
+        "m": m,
+        "exact": exact,
+        "sign": sign,
+        "obj_scale": obj_scale,
+    }
+
+
+def choose_entering(tableau, bland=False):
+    """
+    选择进入变量
+
+    参数:
+    tableau - build_tableau 返回的单纯形表
+    bland - True 时使用 Bland 规则（下标最小的负检验数列），否则使用 Dantzig 规则
+
+    返回:
+    进入变量的列下标；已达最优时返回 None
+    """
+    # 公共分母恒为正，检验数的符号与整数分子相同
+    reduced = tableau["T"][-1, :-1]
+    negative = np.flatnonzero(reduced < -_tol(tableau))
+    if negative.size == 0:
+        return None
+    if bland:
+        return int(negative[0])
+    return int(negative[np.argmin(reduced[negative])])
+
+
+def choose_leaving(tableau, s, bland=False):
+    """
+    最小比值检验，选择退出变量
+
+    参数:
+    tableau - 单纯形表
+    s - 进入变量的列下标
+    bland - True 时比值相同的行中选基变量下标最小的行
+
+    返回:
+    退出行的下标；该列无正元素（问题无界）时返回 None
+    """
+    T = tableau["T"]
+    column = T[:-1, s]
+    candidates = np.flatnonzero(column > _tol(tableau))
+    if candidates.size == 0:
+        return None
+
+    # 公共分母在比值中约去；精确模式用 Fraction 比较，避免浮点误差
+    if tableau["exact"]:
+        ratios = [Fraction(T[i, -1], T[i, s]) for i in candidates]
+    else:
+        ratios = list(T[candidates, -1] / column[candidates])
+    best = min(ratios)
+    ties = [i for i, r in zip(candidates, ratios) if r == best]
+    if bland:
+        return int(min(ties, key=lambda i: tableau["basis"][i]))
+    return int(ties[0])
+
+
+def pivot(tableau, r, s, trace=None, kind=0):
+    """
+    以第 r 行、第 s 列为枢轴元素做旋转变换（原地修改）
+
+    精确模式使用无分数整数旋转：设旧公共分母为 d、枢轴元素分子为 p，
+    则枢轴行保持不变，其余各行 T_i <- (p * T_i - T_is * T_r) / d（整除一定精确），
+    新公共分母为 p。
+
+    参数:
+    tableau - 单纯形表
+    r - 枢轴行（退出变量所在行）
+    s - 枢轴列（进入变量）
+    trace - new_trace 创建的旋转记录，None 表示不记录
+    kind - 记录中的旋转类型，0 为原始单纯形法，1 为对偶单纯形法
+    """
+    T = tableau["T"]
+    p = T[r, s]
+    leaving = tableau["basis"][r]
+    pivot_value = p / tableau["denom"] if trace is not None else None
+    if tableau["exact"]:
+        d = tableau["denom"]
+        factors = T[:, s].copy()
+        pivot_row = T[r].copy()
+        T[:] = (p * T - np.outer(factors, pivot_row)) // d
+        T[r] = pivot_row
+        tableau["denom"] = p
+        # 对偶单纯形法的枢轴元素为负，整体变号使公共分母保持为正
+        if p < 0:
+            T[:] = -T
+            tableau["denom"] = -p
+    else:
+        T[r] /= p
+        factors = T[:, s].copy()
+        factors[r] = 0.0
+        T -= np.outer(factors, T[r])
+    tableau["basis"][r] = s
+
+    if trace is not None:
+        record_pivot(trace, kind, r, s, leaving, pivot_value, objective_value(tableau))
+
+
+def tableau_values(tableau):
+    """
+    返回单纯形表中的真实数值
+
+    返回:
+    精确模式为 Fraction 对象数组，浮点模式为 float 数组
+    """
+    if tableau["exact"]:
+        d = tableau["denom"]
+        return np.array(
+            [[Fraction(v, d) for v in row] for row in tableau["T"]], dtype=object
+        )
+    return tableau["T"].copy()
+
+
+def objective_value(tableau):
+    """当前目标函数值（float），供旋转记录使用"""
+    T = tableau["T"]
+    if tableau["exact"]:
+        return tableau["sign"] * T[-1, -1] / (tableau["denom"] * tableau["obj_scale"])
+    return tableau["sign"] * float(T[-1, -1])
+
+
+def current_solution(tableau):
+    """
+    读取当前基本可行解
+
+    返回:
+    x - 原变量的取值（长度 n）
+    objective - 当前目标函数值
+    """
+    T, n = tableau["T"], tableau["n"]
+    if tableau["exact"]:
+        d = tableau["denom"]
+        x = [Fraction(0)] * n
+        for i, j in enumerate(tableau["basis"]):
+            if j < n:
+                x[j] = Fraction(T[i, -1], d)
+        value = Fraction(T[-1, -1], d * tableau["obj_scale"])
+    else:
+        x = np.zeros(n)
+        for i, j in enumerate(tableau["basis"]):
+            if j < n:
+                x[j] = T[i, -1]
+        value = T[-1, -1]
+    return x, tableau["sign"] * value
+
+
+def solve_tableau(c, A, b, maximize=True, exact=True, max_iter=10000, degenerate_limit=5, trace=None):
+    """
+    用单纯形表求解 max/min c^T x, A x <= b, x >= 0 (b >= 0)
+
+    参数:
+    c, A, b, maximize, exact - 同 build_tableau
+    max_iter - 最大旋转次数
+    degenerate_limit - 连续退化旋转（目标值不变）达到该次数后改用 Bland 规则
+    trace - new_trace 创建的旋转记录，None 表示不记录
+
+    返回:
+    字典，包含：
+    status - "Optimal"、"Unbounded" 或 "Not Solved"（达到最大迭代次数）
+    x - 最优解
+    objective - 最优目标值
+    iterations - 旋转次数
+    tableau - 最终单纯形表
+    """
+    tableau = build_tableau(c, A, b, maximize, exact)
+    if trace is not None:
+        start_segment(trace, tableau)
+    status = "Not Solved"
+    degenerate = 0
+    iterations = 0
+    while iterations < max_iter:
+        bland = degenerate >= degenerate_limit
+        s = choose_entering(tableau, bland)
+        if s is None:
+            status = "Optimal"
+            break
+        r = choose_leaving(tableau, s, bland)
+        if r is None:
+            status = "Unbounded"
+            break
+        # 右端项为0时旋转不改变目标值，属于退化旋转
+        degenerate = degenerate + 1 if abs(tableau["T"][r, -1]) <= _tol(tableau) else 0
+        pivot(tableau, r, s, trace)
+        iterations += 1
+
+    x, objective = current_solution(tableau)
+    return {
+        "status": status,
+        "x": x,
+        "objective": objective,
+        "iterations": iterations,
+        "tableau": tableau,
+    }
+
+
+def add_constraint(tableau, coefficients, rhs):
+    """
+    向已求解的单纯形表追加一条约束 coefficients^T x <= rhs（原地修改）
+
+    新约束的松弛变量作为新行的基变量，并用当前各行消去新行中基变量的系数，
+    使表保持规范形式。若当前解违反新约束，新行右端项为负，可用 dual_simplex 重新优化。
+    收紧变量边界也可以写成这种形式，例如 x2 <= 2 或 -x1 <= -1。
+
+    参数:
+    tableau - 单纯形表
+    coefficients - 新约束在原变量上的系数，长度 n
+    rhs - 新约束的右端项
+    """
+    n = tableau["n"]
+    T = tableau["T"]
+    row = [Fraction(v) for v in coefficients] + [Fraction(0)] * (T.shape[1] - 1 - n)
+    rhs = Fraction(rhs)
+
+    if tableau["exact"]:
+        # 整张表乘以新行分母的最小公倍数，保证新行的分子都是整数
+        scale = lcm(*(v.denominator for v in row + [rhs]))
+        if scale > 1:
+            T *= scale
+            tableau["denom"] *= scale
+        d = tableau["denom"]
+        new_row = np.array([int(v * d) for v in row] + [d, int(rhs * d)], dtype=object)
+        body = np.hstack([T[:, :-1], np.zeros((T.shape[0], 1), dtype=object), T[:, -1:]])
+    else:
+        new_row = np.array([float(v) for v in row] + [1.0, float(rhs)])
+        body = np.hstack([T[:, :-1], np.zeros((T.shape[0], 1)), T[:, -1:]])
+
+    # 消去新行中当前基变量的系数（各约束行基变量系数的真实值为1）
+    for i, j in enumerate(tableau["basis"]):
+        if row[j] != 0:
+            if tableau["exact"]:
+                new_row -= np.array([int(row[j] * v) for v in body[i]], dtype=object)
+            else:
+                new_row -= float(row[j]) * body[i]
+
+    tableau["T"] = np.vstack([body[:-1], new_row, body[-1:]])
+    tableau["basis"].append(T.shape[1] - 1)
+    tableau["m"] += 1
+
+
+def dual_simplex(tableau, max_iter=10000, trace=None):
+    """
+    对偶单纯形法：从对偶可行（检验数均非负）但右端项有负值的表出发重新优化（原地修改）
+
+    每次选择右端项最负的行作为退出行，在该行负系数的列中按
+    |检验数 / 系数| 最小选择进入变量，保持对偶可行。
+
+    参数:
+    tableau - 单纯形表（通常是 add_constraint 之后的最优表）
+    max_iter - 最大旋转次数
+    trace - new_trace 创建的旋转记录，None 表示不记录
+
+    返回:
+    status - "Optimal"、"Infeasible"（新约束使问题不可行）或 "Not Solved"
+    iterations - 旋转次数
+    """
+    if trace is not None:
+        start_segment(trace, tableau)
+    for iteration in range(max_iter):
+        T = tableau["T"]
+        rhs = T[:-1, -1]
+        negative = np.flatnonzero(rhs < -_tol(tableau))
+        if negative.size == 0:
+            return "Optimal", iteration
+        r = int(negative[np.argmin(rhs[negative])])
+
+        row = T[r, :-1]
+        candidates = np.flatnonzero(row < -_tol(tableau))
+        if candidates.size == 0:
+            return "Infeasible", iteration
+        # 公共分母在比值中约去
+        if tableau["exact"]:
+            ratios = [Fraction(T[-1, j], -T[r, j]) for j in candidates]
+        else:
+            ratios = list(T[-1, candidates] / -row[candidates])
+        s = int(candidates[int(np.argmin(ratios))])
+        pivot(tableau, r, s, trace, kind=1)
+
+    return "Not Solved", max_iter
+
+
+def new_trace(capacity=256, verbosity=1):
+    """
+    创建旋转记录
+
+    参数:
+    capacity - 预先分配的记录条数，不够时容量加倍
+    verbosity - render_trace 的默认详细程度：
+                0 不输出；1 旋转记录表；2 旋转记录 + 最终单纯形表；3 旋转记录 + 每一步的单纯形表
+
+    返回:
+    trace - 字典，log 为 TRACE_DTYPE 结构化数组，size 为已记录条数，
+            segments 为各段求解开始时的单纯形表副本 [(起始步数, 表), ...]，用于按需重放
+    """
+    return {
+        "log": np.zeros(capacity, dtype=TRACE_DTYPE),
+        "size": 0,
+        "segments": [],
+        "verbosity": verbosity,
+    }
+
+
+def _copy_tableau(tableau):
+    copied = dict(tableau)
+    copied["T"] = tableau["T"].copy()
+    copied["basis"] = list(tableau["basis"])
+    return copied
+
+
+def start_segment(trace, tableau):
+    """开始一段新的求解（如 solve_tableau、追加约束后的 dual_simplex），保存当前表用于重放"""
+    trace["segments"].append((trace["size"], _copy_tableau(tableau)))
+
+
+def record_pivot(trace, kind, row, entering, leaving, pivot_value, objective):
+    """向旋转记录追加一条，只写入数值，不做任何格式化"""
+    if trace["size"] == len(trace["log"]):
+        grown = np.zeros(2 * len(trace["log"]), dtype=TRACE_DTYPE)
+        grown[: trace["size"]] = trace["log"]
+        trace["log"] = grown
+    trace["log"][trace["size"]] = (
+        trace["size"] + 1, kind, row, entering, leaving, pivot_value, objective,
+    )
+    trace["size"] += 1
+
+
+def trace_log(trace):
+    """返回已记录的旋转（结构化数组视图）"""
+    return trace["log"][: trace["size"]]
+
+
+def trace_tableau(trace, step):
+    """
+    重放旋转，得到第 step 次旋转之后的单纯形表（step=0 为第一段开始时的表）
+
+    参数:
+    trace - 旋转记录
+    step - 步数，0 <= step <= 已记录条数
+
+    返回:
+    tableau - 该步的单纯形表（副本）
+    """
+    start, tableau = [seg for seg in trace["segments"] if seg[0] <= step][-1]
+    tableau = _copy_tableau(tableau)
+    for record in trace["log"][start:step]:
+        pivot(tableau, int(record["row"]), int(record["entering"]))
+    return tableau
+
+
+def format_value(value):
+    """格式化单元格：有理数显示为 a/b，浮点数先近似为分数再显示"""
+    if isinstance(value, (float, np.floating)):
+        value = Fraction(float(value)).limit_denominator()
+    elif not isinstance(value, Fraction):
+        return str(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+    return f"{value.numerator}/{value.denominator}"
+
+
+def render_tableau(tableau, names=None, title=None):
+    """
+    将单纯形表渲染为文本
+
+    参数:
+    tableau - 单纯形表
+    names - 各列变量名（原变量 + 松弛变量），默认 x1, x2, ..., s1, s2, ...
+    title - 标题
+
+    返回:
+    表格文本
+    """
+    n = tableau["n"]
+    width = tableau["T"].shape[1] - 1
+    if names is None:
+        names = [f"x{j + 1}" for j in range(n)] + [f"s{j + 1}" for j in range(width - n)]
+    values = tableau_values(tableau)
+    rows = [[names[j]] + [format_value(v) for v in values[i]] for i, j in enumerate(tableau["basis"])]
+    rows.append(["z"] + [format_value(v) for v in values[-1]])
+    table = tabulate(rows, headers=["Basis"] + list(names) + ["RHS"], tablefmt="heavy_grid",
+                     numalign="right", stralign="right")
+    return table if title is None else f"--- {title} ---\n{table}"
+
+
+def render_trace(trace, names=None, verbosity=None):
+    """
+    按需把旋转记录渲染为文本
+
+    参数:
+    trace - 旋转记录
+    names - 各列变量名，同 render_tableau
+    verbosity - 详细程度，None 表示使用 new_trace 时设置的值
+
+    返回:
+    文本；verbosity=0 时为空字符串
+    """
+    verbosity = trace["verbosity"] if verbosity is None else verbosity
+    if verbosity <= 0:
+        return ""
+    log = trace_log(trace)
+    if names is None:
+        last = trace_tableau(trace, trace["size"])
+        n, width = last["n"], last["T"].shape[1] - 1
+        names = [f"x{j + 1}" for j in range(n)] + [f"s{j + 1}" for j in range(width - n)]
+
+    rows = [
+        [rec["step"], "dual" if rec["kind"] else "primal", names[rec["entering"]],
+         names[rec["leaving"]], f"{rec['pivot']:.6g}", f"{rec['objective']:.6g}"]
+        for rec in log
+    ]
+    parts = [tabulate(rows, headers=["Step", "Type", "Entering", "Leaving", "Pivot", "Objective"],
+                      tablefmt="simple")]
+
+    if verbosity >= 3:
+        for step in range(trace["size"] + 1):
+            tableau = trace_tableau(trace, step)
+            parts.append(render_tableau(tableau, names[: tableau["T"].shape[1] - 1], f"Step {step}"))
+    elif verbosity >= 2:
+        tableau = trace_tableau(trace, trace["size"])
+        parts.append(render_tableau(tableau, names[: tableau["T"].shape[1] - 1], f"Step {trace['size']}"))
+    return "\n\n".join(parts)
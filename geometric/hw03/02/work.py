@@ -1,8 +1,16 @@
 from fractions import Fraction
 from tabulate import tabulate
 import io
+import os
 import sys
 
+# 预处理模块在 final/code 目录下
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "final", "code"))
+from lp_presolve import presolve_lp, format_presolve_report
+from simplex import build_tableau, choose_entering, choose_leaving, pivot, tableau_values, current_solution, add_constraint, dual_simplex
+from simplex import solve_tableau, new_trace, render_trace, format_value
+from revised_simplex import solve_revised_simplex, reoptimize_dual
+
 # Capture print output to format it later if needed, or just print directly
 # output_buffer = io.StringIO()
 # sys.stdout = output_buffer # Redirect stdout
@@ -74,24 +82,18 @@ explanation = """
 
 print(explanation)
 
+# --- Presolve: y >= 5 写成 -y <= -5 后只含一个变量，预处理直接把它转为 y 的下界 ---
+presolved = presolve_lp([10, 35], [[8, 6], [4, 1], [0, -1]], [48, 20, -5])
+print(format_presolve_report(presolved))
+print(f"预处理后的变量边界 (x, y): {presolved['bounds']}")
+print(f"预处理后剩余约束: {presolved['A_ub'].toarray().tolist()} <= {presolved['b_ub'].tolist()}")
+
 
 # Helper function to display the tableau
 def display_tableau(tableau_data, headers, title):
     """Displays the simplex tableau using tabulate."""
-    formatted_data = []
-    for row in tableau_data:
-        formatted_row = [row[0]] # Keep the basis variable as string
-        for item in row[1:]:
-             if isinstance(item, (int, float, Fraction)):
-                 # Format fractions nicely
-                 frac = Fraction(item).limit_denominator()
-                 if frac.denominator == 1:
-                     formatted_row.append(str(frac.numerator)) # Display integers directly
-                 else:
-                     formatted_row.append(f"{frac.numerator}/{frac.denominator}") # Display as fraction
-             else:
-                 formatted_row.append(str(item)) # Keep other things as string (like '*')
-        formatted_data.append(formatted_row)
+    # 精确模式下单元格已经是 Fraction，直接格式化，不再逐个 limit_denominator
+    formatted_data = [[row[0]] + [format_value(item) for item in row[1:]] for row in tableau_data]
 
     print(f"\n--- {title} ---")
     # Use a simpler table format for potentially better rendering in various terminals
@@ -99,117 +101,85 @@ def display_tableau(tableau_data, headers, title):
     print("-" * (sum(len(h) for h in headers) + len(headers)*3 + 1) ) # Adjust separator length
 
 
-# --- Simplex Tableau 0 (Initial Tableau) ---
-headers_0 = ['Basis', 'x1', 'x2', 'y1', 'y2', 'z', 'RHS'] # Use y1, y2 as slack names
-data_0 = [
-    ['y1',  8,   6,  1,  0, 0,  18],
-    ['y2',  4,   1,  0,  1, 0,  15],
-    ['z', -10, -35,  0,  0, 1,   0]
-]
-
-display_tableau(data_0, headers_0, "单纯形表 0 (原始表 / Simplex Tableau 0)")
-
-print("\n分析表 0 (Analysis of Tableau 0):")
-print("*   相关变量 (Basic): {y1, y2, z}")
-print("*   独立变量 (Non-Basic): {x1, x2} = (0, 0)")
-print("*   当前极点 (Transformed x1, x2): (0, 0)")
-print("*   当前目标函数值 (z): 0")
-
-# --- Iteration 1: Pivot Selection ---
-print("\n--- 迭代 1: 确定枢轴元素 (Iteration 1: Pivot Selection) ---")
-print("1. 最优化检验 (Optimality Check): 检查 'z' 行是否存在负系数。")
-print("   最小负系数是 -35，在 x2 列。")
-print("   ==> x2 为进入变量 (Entering Variable)。")
-
-print("\n2. 可行性检验 (比值测试 / Feasibility Check - Ratio Test): 用右端项 (RHS) 除以进入变量列 (x2) 中的正系数。")
-ratio1 = Fraction(data_0[0][-1], data_0[0][2]) if data_0[0][2] > 0 else float('inf')
-ratio2 = Fraction(data_0[1][-1], data_0[1][2]) if data_0[1][2] > 0 else float('inf')
-print(f"   y1 行: {data_0[0][-1]} / {data_0[0][2]} = {ratio1} = 3")
-print(f"   y2 行: {data_0[1][-1]} / {data_0[1][2]} = {ratio2} = 15")
-print("   最小正比值是 3，对应于 y1 行。")
-print("   ==> y1 为退出变量 (Leaving Variable)。")
-
-pivot_element = data_0[0][2]
-print(f"\n3. 枢轴元素 (Pivot Element): 进入变量列 (x2) 和退出变量行 (y1) 的交叉点。")
-print(f"   枢轴元素 = {pivot_element} (在 y1 行, x2 列)")
-
-# --- Iteration 1: Pivot Operation ---
-print("\n--- 迭代 1: 执行旋转变换 (Iteration 1: Performing Pivot Operation) ---")
-print(f"目标: 使枢轴元素变为 1，枢轴列的其他元素变为 0。")
-
-# Calculate new rows using fractions
-pivot_row_old = [Fraction(x) for x in data_0[0][1:]] # y1 row, numerical part
-pivot_val = Fraction(pivot_element)
-
-# 1. New Pivot Row (new x2 row)
-new_x2_row_vals = [x / pivot_val for x in pivot_row_old]
-print(f"1. 新 x2 行 = (旧 y1 行) / {pivot_val}")
-print(f"   [{', '.join(map(str, pivot_row_old))}] / {pivot_val} = [{', '.join(f'{v.numerator}/{v.denominator}' if v.denominator != 1 else str(v.numerator) for v in new_x2_row_vals)}]")
-
-# 2. New y2 row
-old_y2_row_vals = [Fraction(x) for x in data_0[1][1:]] # y2 row
-factor_y2 = Fraction(data_0[1][2]) # Coefficient in pivot column for y2 row
-new_y2_row_vals = [old - factor_y2 * new for old, new in zip(old_y2_row_vals, new_x2_row_vals)]
-print(f"2. 新 y2 行 = (旧 y2 行) - ({factor_y2}) * (新 x2 行)")
-print(f"   [{', '.join(map(str, old_y2_row_vals))}] - {factor_y2} * [...] = [{', '.join(f'{v.numerator}/{v.denominator}' if v.denominator != 1 else str(v.numerator) for v in new_y2_row_vals)}]")
-
-
-# 3. New z row
-old_z_row_vals = [Fraction(x) for x in data_0[2][1:]] # z row
-factor_z = Fraction(data_0[2][2]) # Coefficient in pivot column for z row
-new_z_row_vals = [old - factor_z * new for old, new in zip(old_z_row_vals, new_x2_row_vals)]
-print(f"3. 新 z 行  = (旧 z 行) - ({factor_z}) * (新 x2 行)")
-print(f"   [{', '.join(map(str, old_z_row_vals))}] - ({factor_z}) * [...] = [{', '.join(f'{v.numerator}/{v.denominator}' if v.denominator != 1 else str(v.numerator) for v in new_z_row_vals)}]")
-
-# --- Simplex Tableau 1 ---
-headers_1 = ['Basis', 'x1', 'x2', 'y1', 'y2', 'z', 'RHS']
-# Assemble data_1 with correct types (strings for basis, Fractions for numbers)
-data_1 = [
-    ['x2'] + new_x2_row_vals,
-    ['y2'] + new_y2_row_vals,
-    ['z']  + new_z_row_vals
-]
-
-display_tableau(data_1, headers_1, "单纯形表 1 (Simplex Tableau 1)")
-
-print("\n分析表 1 (Analysis of Tableau 1):")
-print("*   相关变量 (Basic): {x2, y2, z}")
-print("*   独立变量 (Non-Basic): {x1, y1} = (0, 0)")
-# Find the value of basic variables from RHS
-x1_val_t1 = 0 # non-basic
-x2_val_t1 = data_1[0][-1] # Find x2 row, get RHS
-print(f"*   当前极点 (Transformed x1, x2): ({x1_val_t1}, {x2_val_t1}) = (0, 3)")
-z_val_t1 = data_1[2][-1] # Find z row, get RHS
-print(f"*   当前目标函数值 (z): {z_val_t1} = 105")
-
-# --- Optimality Check after Iteration 1 ---
-print("\n--- 表 1 最优化检验 (Optimality Check for Tableau 1) ---")
-print("检查 'z' 行中非基变量 (x1, y1) 的系数。")
-coeff_x1 = data_1[2][1]
-coeff_y1 = data_1[2][3]
-print(f"   x1 的系数 = {coeff_x1.numerator}/{coeff_x1.denominator if coeff_x1.denominator != 1 else ''} = 110/3")
-print(f"   y1 的系数 = {coeff_y1.numerator}/{coeff_y1.denominator if coeff_y1.denominator != 1 else ''} = 35/6")
-print("   'z' 行中的所有系数（对应非基变量）都非负。")
-print("==> 当前解对于变换后的问题是最优的 (Optimal for the transformed problem)。")
+# --- 由预处理得到的下界做变量替换 (x = x1 + lb_x, y = x2 + lb_y) ---
+# 这正是上面手工完成的 y = x2 + 5，变换后的问题可以直接交给单纯形表求解器
+c_orig = [10, 35]
+lower = [Fraction(low) for low, _ in presolved["bounds"]]
+A_t = [[Fraction(v) for v in row] for row in presolved["A_ub"].toarray()]
+b_t = [Fraction(v) - sum(a * low for a, low in zip(row, lower))
+       for v, row in zip(presolved["b_ub"], A_t)]
+offset = sum(ci * low for ci, low in zip(c_orig, lower))
+print(f"\n变量替换后: 约束右端项 = {[str(v) for v in b_t]}, 目标常数 = {offset}")
+
+headers = ['Basis', 'x1', 'x2', 'y1', 'y2', 'z', 'RHS'] # Use y1, y2 as slack names
+names = headers[1:5]
+
+
+def tableau_rows(tableau):
+    """将求解器的单纯形表转换为显示用的行（补上 z 列）"""
+    values = tableau_values(tableau)
+    rows = [[names[j]] + list(values[i, :-1]) + [0, values[i, -1]]
+            for i, j in enumerate(tableau["basis"])]
+    rows.append(['z'] + list(values[-1, :-1]) + [1, values[-1, -1]])
+    return rows
+
+
+# --- 迭代求解：进入变量、退出变量均由求解器选择 ---
+tableau = build_tableau(c_orig, A_t, b_t, exact=True)
+step = 0
+while True:
+    title = "单纯形表 0 (原始表 / Simplex Tableau 0)" if step == 0 else f"单纯形表 {step} (Simplex Tableau {step})"
+    display_tableau(tableau_rows(tableau), headers, title)
+
+    x_cur, z_cur = current_solution(tableau)
+    basic = [names[j] for j in tableau["basis"]]
+    print(f"\n分析表 {step} (Analysis of Tableau {step}):")
+    print(f"*   相关变量 (Basic): {{{', '.join(basic + ['z'])}}}")
+    print(f"*   独立变量 (Non-Basic): {{{', '.join(v for v in names if v not in basic)}}} = 0")
+    print(f"*   当前极点 (Transformed x1, x2): ({x_cur[0]}, {x_cur[1]})")
+    print(f"*   当前目标函数值 (z): {z_cur}")
+
+    s = choose_entering(tableau)
+    if s is None:
+        print("\n'z' 行中的所有系数（对应非基变量）都非负。")
+        print("==> 当前解对于变换后的问题是最优的 (Optimal for the transformed problem)。")
+        break
+
+    step += 1
+    values = tableau_values(tableau)
+    print(f"\n--- 迭代 {step}: 确定枢轴元素 (Iteration {step}: Pivot Selection) ---")
+    print(f"1. 最优化检验 (Optimality Check): 'z' 行最小负系数是 {values[-1, s]}，在 {names[s]} 列。")
+    print(f"   ==> {names[s]} 为进入变量 (Entering Variable)。")
+
+    r = choose_leaving(tableau, s)
+    if r is None:
+        print(f"   {names[s]} 列没有正系数，问题无界 (Unbounded)。")
+        break
+    print(f"2. 可行性检验 (比值测试 / Ratio Test): 用右端项 (RHS) 除以 {names[s]} 列中的正系数。")
+    for i, j in enumerate(tableau["basis"]):
+        if values[i, s] > 0:
+            print(f"   {names[j]} 行: {values[i, -1]} / {values[i, s]} = {values[i, -1] / values[i, s]}")
+    print(f"   ==> {names[tableau['basis'][r]]} 为退出变量 (Leaving Variable)。")
+    print(f"3. 枢轴元素 (Pivot Element) = {values[r, s]} (在 {names[tableau['basis'][r]]} 行, {names[s]} 列)")
+
+    pivot(tableau, r, s)
 
 # --- Final Solution ---
 print("\n--- 最终解 (Final Solution) ---")
-opt_x1 = 0 # Non-basic
-opt_x2 = data_1[0][-1] # Basic variable x2's value from RHS
-opt_z = data_1[2][-1] # Value from RHS in z row
-
-print(f"变换后问题的最优解 (Optimal x1, x2): ({opt_x1}, {opt_x2}) = (0, 3)")
-print(f"变换后问题的最优目标值 (Optimal z): {opt_z} = 105")
+opt, opt_z = current_solution(tableau)
+opt_x1, opt_x2 = opt
+print(f"变换后问题的最优解 (Optimal x1, x2): ({opt_x1}, {opt_x2})")
+print(f"变换后问题的最优目标值 (Optimal z): {opt_z}")
 
 # Convert back to original variables
-opt_x = opt_x1
-opt_y = opt_x2 + 5
-opt_Z = opt_z + 175
+opt_x = opt_x1 + lower[0]
+opt_y = opt_x2 + lower[1]
+opt_Z = opt_z + offset
 
 print("\n转换回原始变量 (x, y, Z):")
-print(f"*   x = x1 = {opt_x}")
-print(f"*   y = x2 + 5 = {opt_x2} + 5 = {opt_y}")
-print(f"*   最大 Z = z + 175 = {opt_z} + 175 = {opt_Z}")
+print(f"*   x = x1 + {lower[0]} = {opt_x}")
+print(f"*   y = x2 + {lower[1]} = {opt_x2} + {lower[1]} = {opt_y}")
+print(f"*   最大 Z = z + {offset} = {opt_z} + {offset} = {opt_Z}")
 
 print("\n====================================================================")
 print(f"  原问题的最终答案:")
@@ -217,6 +187,40 @@ print(f"  最优解为 x = {opt_x}, y = {opt_y}")
 print(f"  最大目标函数值为 Z = {opt_Z}")
 print("====================================================================")
 
+# --- 修正单纯形法：直接处理 y >= 5 这一变量下界，不需要变量替换 ---
+revised = solve_revised_simplex([10, 35], [[8, 6], [4, 1]], [48, 20], bounds=[(0, None), (5, None)])
+print("\n修正单纯形法 (Revised Simplex, 直接处理变量上下界):")
+print(f"  状态: {revised['status']}, 迭代次数: {revised['iterations']}")
+print(f"  x = {revised['x'][0]:g}, y = {revised['x'][1]:g}, Z = {revised['objective']:g}")
+
+
+# --- 对偶单纯形法：在最优表上追加约束 y <= 7 (即 x2 <= 2)，从当前基重新优化 ---
+print("\n====================================================================")
+print("  追加约束 y <= 7 (x2 <= 2)，用对偶单纯形法重新优化 (Dual Simplex)")
+print("====================================================================")
+add_constraint(tableau, [0, 1], 7 - lower[1])
+headers = ['Basis', 'x1', 'x2', 'y1', 'y2', 'y3', 'z', 'RHS']
+names = headers[1:6]
+display_tableau(tableau_rows(tableau), headers, "追加约束后的单纯形表 (右端项为负，原始不可行)")
+status, iterations = dual_simplex(tableau)
+display_tableau(tableau_rows(tableau), headers, f"对偶单纯形法 {iterations} 次旋转后的单纯形表 ({status})")
+cut_opt, cut_z = current_solution(tableau)
+print(f"新的最优解: x = {cut_opt[0] + lower[0]}, y = {cut_opt[1] + lower[1]}, Z = {cut_z + offset}")
+
+# 修正单纯形法的最优基同样可以热启动：直接收紧 y 的上界
+revised_cut = reoptimize_dual(revised, bounds={1: (5, 7)})
+print(f"修正单纯形法热启动: 迭代 {revised_cut['iterations']} 次, "
+      f"x = {revised_cut['x'][0]:g}, y = {revised_cut['x'][1]:g}, Z = {revised_cut['objective']:g}")
+
+# --- 旋转记录：求解时只记录数值，需要时再按详细程度渲染 ---
+trace = new_trace(verbosity=1)
+traced = solve_tableau(c_orig, A_t, b_t, trace=trace)
+add_constraint(traced["tableau"], [0, 1], 7 - lower[1])
+dual_simplex(traced["tableau"], trace=trace)
+print("\n旋转记录 (Pivot Trace):")
+print(render_trace(trace, names=names))
+
+
 # # If using output buffer, print it now
 # sys.stdout = sys.__stdout__ # Restore standard output
-# print(output_buffer.getvalue())
\ No newline at end of file
+# print(output_buffer.getvalue())